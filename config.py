@@ -13,7 +13,7 @@ class ASRConfig:
     model_path: str = "hindi_models/whisper-medium-hi_alldata_multigpu"
     device: str = "cuda"  # "cuda" or "cpu"
     default_language: str = "hi"
-    batch_size: int = 1
+    batch_size: int = 16  # padded inference batch for transcribe_batch
     
     # Supported language codes
     supported_languages: Dict[str, str] = field(default_factory=lambda: {
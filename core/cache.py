@@ -0,0 +1,184 @@
+"""
+LLM Response Cache - Deterministic caching for repeated LLM queries.
+Common utterances classify identically every time; serving them from a
+cache costs microseconds instead of a network round-trip.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """
+    LRU cache keyed on a SHA-256 of the normalized query, with optional
+    TTL expiry and an optional shelve file for across-run persistence.
+
+    Intended for deterministic (low/zero temperature) LLM calls where
+    the same input always yields the same answer - intent
+    classification, slot extraction and the like.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: Optional[float] = None,
+        disk_path: Optional[str] = None
+    ):
+        """
+        Args:
+            maxsize: Max entries held in memory before LRU eviction
+            ttl: Seconds before an entry expires (None = never)
+            disk_path: Optional shelve path for across-run persistence
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (monotonic stamp, value)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # shelve handle: None = not tried, False = unavailable
+        self._disk = None
+        self._disk_path = disk_path
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(query: str) -> str:
+        """Hash the normalized query (lowercased, whitespace collapsed)."""
+        normalized = " ".join(query.lower().split())
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def _get_disk(self):
+        if self._disk is None:
+            if self._disk_path:
+                import shelve
+                try:
+                    self._disk = shelve.open(self._disk_path)
+                except Exception as e:
+                    logger.warning(f"LLM disk cache unavailable: {e}")
+                    self._disk = False
+            else:
+                self._disk = False
+        return None if self._disk is False else self._disk
+
+    def get(self, query: str) -> Optional[Any]:
+        """Return the cached value for query, or None on miss/expiry."""
+        key = self.make_key(query)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            stamp, value = entry
+            if self.ttl is None or time.monotonic() - stamp <= self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        disk = self._get_disk()
+        if disk is not None:
+            value = disk.get(key)
+            if value is not None:
+                self._entries[key] = (time.monotonic(), value)
+                self.hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    def set(self, query: str, value: Any) -> None:
+        """Store a value, evicting the least recently used on overflow."""
+        key = self.make_key(query)
+        self._entries[key] = (time.monotonic(), value)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+        disk = self._get_disk()
+        if disk is not None:
+            try:
+                disk[key] = value
+                disk.sync()
+            except Exception as e:
+                logger.warning(f"LLM disk cache write failed: {e}")
+
+
+class SemanticCache:
+    """
+    Near-duplicate query cache using sentence embeddings.
+
+    Exact-match caching misses paraphrases ("Book a cab to airport" vs
+    "book cab to airport please"); this layer reuses a prior result
+    when the cosine similarity of the query embeddings clears a high
+    threshold. Requires fastembed and numpy - when either is missing
+    the cache silently degrades to a no-op, so callers never need to
+    guard for availability.
+    """
+
+    def __init__(self, threshold: float = 0.95, maxsize: int = 2048):
+        """
+        Args:
+            threshold: Min cosine similarity to reuse a prior result
+            maxsize: Max remembered queries before the oldest are dropped
+        """
+        self.threshold = threshold
+        self.maxsize = maxsize
+        # embedding model: None = not tried, False = unavailable
+        self._model = None
+        self._vecs = None  # np.ndarray (N, dim), rows L2-normalized
+        self._results: list = []
+        self.hits = 0
+        self.misses = 0
+
+    def _get_model(self):
+        if self._model is None:
+            try:
+                from fastembed import TextEmbedding
+                self._model = TextEmbedding("BAAI/bge-small-en-v1.5")
+            except Exception:
+                logger.debug("fastembed unavailable; semantic cache disabled")
+                self._model = False
+        return None if self._model is False else self._model
+
+    def _encode(self, query: str):
+        """L2-normalized embedding of query, or None if unavailable."""
+        model = self._get_model()
+        if model is None:
+            return None
+        import numpy as np
+        vec = np.asarray(next(iter(model.embed([query]))), dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def get(self, query: str) -> Optional[Any]:
+        """Return the nearest prior result above threshold, else None."""
+        vec = self._encode(query)
+        if vec is None or self._vecs is None or not self._results:
+            return None
+
+        # One BLAS matmul against all stored rows; rows are normalized
+        # so the dot products are cosine similarities
+        sims = self._vecs @ vec
+        best = int(sims.argmax())
+        if sims[best] >= self.threshold:
+            self.hits += 1
+            return self._results[best]
+        self.misses += 1
+        return None
+
+    def set(self, query: str, value: Any) -> None:
+        """Remember a query's result for future near-duplicates."""
+        vec = self._encode(query)
+        if vec is None:
+            return
+        import numpy as np
+        if self._vecs is None:
+            self._vecs = vec[np.newaxis, :]
+        else:
+            self._vecs = np.vstack([self._vecs, vec])
+        self._results.append(value)
+
+        if len(self._results) > self.maxsize:
+            self._vecs = self._vecs[1:]
+            self._results.pop(0)
@@ -5,6 +5,7 @@ Analyzes current webpage to provide contextual assistance.
 
 import json
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
 from urllib.parse import urlparse
@@ -260,6 +261,19 @@ Identify interactive elements and guide the user.""",
 )
 
 
+@lru_cache(maxsize=256)
+def _config_for_hostname(hostname: str) -> WebsiteConfig:
+    """Match a hostname against the known website table (memoized).
+
+    WEBSITE_CONTEXTS is static, so caching per hostname is safe and avoids
+    re-walking the domain table on every turn while the user stays on one site.
+    """
+    for domain, config in WEBSITE_CONTEXTS.items():
+        if domain in hostname:
+            return config
+    return DEFAULT_CONFIG
+
+
 @dataclass
 class PageContext:
     """Extracted context from a webpage."""
@@ -301,14 +315,9 @@ class DynamicPromptBuilder:
             parsed = urlparse(url)
             hostname = parsed.hostname or ''
             hostname = hostname.replace('www.', '')
-            
-            # Check for exact or partial matches
-            for domain, config in WEBSITE_CONTEXTS.items():
-                if domain in hostname:
-                    return config
-            
-            return DEFAULT_CONFIG
-            
+
+            return _config_for_hostname(hostname)
+
         except Exception as e:
             logger.error(f"Error parsing URL {url}: {e}")
             return DEFAULT_CONFIG
@@ -5,11 +5,14 @@ Enhanced with improved prompts and few-shot examples for better accuracy.
 
 import json
 import logging
+import os
 import re
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from enum import Enum
 
+from .cache import LLMCache, SemanticCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -208,16 +211,33 @@ class IntentDispatcher:
     Enhanced with keyword matching and improved prompt engineering.
     """
     
+    # Max phrases remembered by the in-process classification cache
+    _CACHE_MAX = 1024
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the Intent Dispatcher.
-        
+
         Args:
             api_key: OpenRouter API key (optional, uses env var if not provided)
         """
         self.api_key = api_key
         self.client = None
-        
+        # Deterministic cache of context-free classification results -
+        # repeated phrases (dev loops, fixed test suites, common
+        # utterances like "Hello") skip the LLM entirely. The calls are
+        # made at temperature 0.1, so replies are stable enough to
+        # cache. Setting VOXNAV_INTENT_CACHE=1 adds across-run
+        # persistence via .voxnav_intent_cache.
+        self._classify_cache = LLMCache(
+            maxsize=self._CACHE_MAX,
+            disk_path=".voxnav_intent_cache"
+            if os.environ.get("VOXNAV_INTENT_CACHE") else None
+        )
+        # Second-chance cache for paraphrases the exact lookup misses;
+        # a no-op unless fastembed + numpy are installed
+        self._semantic_cache = SemanticCache()
+
     def _ensure_client(self):
         """Ensure OpenRouter client is initialized."""
         if self.client is not None:
@@ -279,7 +299,57 @@ class IntentDispatcher:
         if any(word in text.lower().split() for word in hinglish_words):
             return "hinglish"
         return "en"
-    
+
+    def _build_classify_prompt(self, user_input: str, context: Optional[Dict[str, Any]]) -> str:
+        """Assemble the classification prompt for one input."""
+        prompt = build_intent_prompt()
+
+        if context:
+            context_str = f'\nContext: URL={context.get("url", "N/A")}, Page={context.get("page_title", "N/A")}\n'
+            prompt += context_str
+
+        prompt += f'\nInput: "{user_input}"'
+        return prompt
+
+    def _parse_classification(self, raw_text: str, user_input: str, detected_lang: str) -> IntentResult:
+        """Parse a raw LLM reply into an IntentResult.
+
+        Raises json.JSONDecodeError if the reply isn't valid JSON so the
+        caller can fall back to quick classification.
+        """
+        raw_text = raw_text.strip()
+
+        # Clean markdown if present
+        if raw_text.startswith('```'):
+            raw_text = raw_text.split('\n', 1)[1] if '\n' in raw_text else raw_text[3:]
+            raw_text = raw_text.rsplit('```', 1)[0]
+
+        # Remove any leading/trailing non-JSON content. The object
+        # nests (entities), so slice from the first brace to the
+        # last rather than regex-matching, which can't span nesting
+        start, end = raw_text.find('{'), raw_text.rfind('}')
+        if start != -1 and end > start:
+            raw_text = raw_text[start:end + 1]
+
+        result = json.loads(raw_text)
+
+        # Validate and convert intent
+        intent_str = result.get("intent", "UNKNOWN").upper()
+        try:
+            intent = Intent(intent_str)
+        except ValueError:
+            intent = Intent.UNKNOWN
+
+        return IntentResult(
+            intent=intent,
+            confidence=float(result.get("confidence", 0.5)),
+            sub_intent=result.get("sub_intent"),
+            entities=result.get("entities", {}),
+            original_query=user_input,
+            language_detected=result.get("language_detected", detected_lang),
+            raw_response=raw_text
+        )
+
     def classify(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> IntentResult:
         """
         Classify user input into an intent category.
@@ -291,60 +361,43 @@ class IntentDispatcher:
         Returns:
             IntentResult with classified intent and extracted entities
         """
+        # Context-free inputs are memoized: identical phrases return the
+        # cached result without touching the client at all
+        if context is None:
+            cached = self._classify_cache.get(user_input)
+            if cached is not None:
+                return cached
+
+            cached = self._semantic_cache.get(user_input)
+            if cached is not None:
+                return cached
+
         self._ensure_client()
-        
+
         # Quick language detection
         detected_lang = self._detect_language(user_input)
-        
-        # Build prompt
-        prompt = build_intent_prompt()
-        
-        if context:
-            context_str = f'\nContext: URL={context.get("url", "N/A")}, Page={context.get("page_title", "N/A")}\n'
-            prompt += context_str
-        
-        prompt += f'\nInput: "{user_input}"'
-        
+
+        prompt = self._build_classify_prompt(user_input, context)
+
         try:
-            # Call OpenRouter
+            # Call OpenRouter - structured output forces valid JSON in one pass,
+            # so intent + entities come back from a single round-trip
             raw_text = self.client.generate(
                 prompt=prompt,
                 temperature=0.1,  # Low temperature for consistency
-                max_tokens=300
+                max_tokens=300,
+                response_format={"type": "json_object"}
             )
-            
-            raw_text = raw_text.strip()
-            
-            # Clean markdown if present
-            if raw_text.startswith('```'):
-                raw_text = raw_text.split('\n', 1)[1] if '\n' in raw_text else raw_text[3:]
-                raw_text = raw_text.rsplit('```', 1)[0]
-            
-            # Remove any leading/trailing non-JSON content
-            json_match = re.search(r'\{[^{}]*\}', raw_text, re.DOTALL)
-            if json_match:
-                raw_text = json_match.group()
-            
-            # Parse JSON response
-            result = json.loads(raw_text)
-            
-            # Validate and convert intent
-            intent_str = result.get("intent", "UNKNOWN").upper()
-            try:
-                intent = Intent(intent_str)
-            except ValueError:
-                intent = Intent.UNKNOWN
-            
-            return IntentResult(
-                intent=intent,
-                confidence=float(result.get("confidence", 0.5)),
-                sub_intent=result.get("sub_intent"),
-                entities=result.get("entities", {}),
-                original_query=user_input,
-                language_detected=result.get("language_detected", detected_lang),
-                raw_response=raw_text
-            )
-            
+
+            intent_result = self._parse_classification(raw_text, user_input, detected_lang)
+
+            # Only successful, context-free classifications are cached
+            if context is None:
+                self._classify_cache.set(user_input, intent_result)
+                self._semantic_cache.set(user_input, intent_result)
+
+            return intent_result
+
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
             # Fall back to quick classification
@@ -367,6 +420,157 @@ class IntentDispatcher:
                 language_detected=detected_lang
             )
     
+    async def aclassify(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> IntentResult:
+        """
+        Async variant of classify for concurrent callers.
+
+        Shares the same caches and fallback behavior but awaits the
+        client's generate_async, so many classifications can be in
+        flight at once under asyncio.gather instead of serializing on
+        the HTTP round-trip.
+        """
+        if context is None:
+            cached = self._classify_cache.get(user_input)
+            if cached is not None:
+                return cached
+
+            cached = self._semantic_cache.get(user_input)
+            if cached is not None:
+                return cached
+
+        self._ensure_client()
+
+        detected_lang = self._detect_language(user_input)
+        prompt = self._build_classify_prompt(user_input, context)
+
+        try:
+            raw_text = await self.client.generate_async(
+                prompt=prompt,
+                temperature=0.1,
+                max_tokens=300,
+                response_format={"type": "json_object"}
+            )
+
+            intent_result = self._parse_classification(raw_text, user_input, detected_lang)
+
+            if context is None:
+                self._classify_cache.set(user_input, intent_result)
+                self._semantic_cache.set(user_input, intent_result)
+
+            return intent_result
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON response: {e}")
+            quick_intent = self._quick_classify(user_input)
+            return IntentResult(
+                intent=quick_intent or Intent.UNKNOWN,
+                confidence=0.6 if quick_intent else 0.0,
+                original_query=user_input,
+                language_detected=detected_lang,
+                raw_response=raw_text if 'raw_text' in locals() else None
+            )
+        except Exception as e:
+            logger.error(f"Intent classification failed: {e}")
+            quick_intent = self._quick_classify(user_input)
+            return IntentResult(
+                intent=quick_intent or Intent.UNKNOWN,
+                confidence=0.5 if quick_intent else 0.0,
+                original_query=user_input,
+                language_detected=detected_lang
+            )
+
+    def classify_batch(self, user_inputs: List[str]) -> List[IntentResult]:
+        """
+        Classify several inputs with a single LLM round-trip.
+
+        Marshals all inputs into one numbered prompt and asks for a JSON
+        array of result objects, so N phrases cost one network call
+        instead of N. Falls back to per-input quick classification for
+        any row the model fails to return.
+
+        Args:
+            user_inputs: List of transcribed voice inputs
+
+        Returns:
+            List of IntentResult, one per input, in the same order
+        """
+        if not user_inputs:
+            return []
+
+        self._ensure_client()
+
+        detected_langs = [self._detect_language(text) for text in user_inputs]
+
+        prompt = build_intent_prompt()
+        prompt += (
+            '\n\nBATCH MODE: Classify EACH numbered input below. Return ONLY a JSON '
+            'object {"results": [...]} with one result object per input, in order.\n'
+        )
+        prompt += "\n".join(f'{i + 1}. "{text}"' for i, text in enumerate(user_inputs))
+
+        rows: List[Dict[str, Any]] = []
+        try:
+            raw_text = self.client.generate(
+                prompt=prompt,
+                temperature=0.1,
+                max_tokens=100 * len(user_inputs) + 100,
+                response_format={"type": "json_object"}
+            )
+
+            raw_text = raw_text.strip()
+            if raw_text.startswith('```'):
+                raw_text = raw_text.split('\n', 1)[1] if '\n' in raw_text else raw_text[3:]
+                raw_text = raw_text.rsplit('```', 1)[0]
+
+            parsed = json.loads(raw_text)
+            rows = parsed.get("results", []) if isinstance(parsed, dict) else parsed
+        except Exception as e:
+            logger.error(f"Batch intent classification failed: {e}")
+
+        results = []
+        for i, (user_input, detected_lang) in enumerate(zip(user_inputs, detected_langs)):
+            row = rows[i] if i < len(rows) and isinstance(rows[i], dict) else None
+            if row is None:
+                quick_intent = self._quick_classify(user_input)
+                results.append(IntentResult(
+                    intent=quick_intent or Intent.UNKNOWN,
+                    confidence=0.6 if quick_intent else 0.0,
+                    original_query=user_input,
+                    language_detected=detected_lang
+                ))
+                continue
+
+            # A row can be present but malformed (null intent, non-numeric
+            # confidence) - treat it like a missing row instead of letting
+            # one bad row fail the whole batch
+            try:
+                try:
+                    intent = Intent(row.get("intent", "UNKNOWN").upper())
+                except ValueError:
+                    intent = Intent.UNKNOWN
+
+                result = IntentResult(
+                    intent=intent,
+                    confidence=float(row.get("confidence", 0.5)),
+                    sub_intent=row.get("sub_intent"),
+                    entities=row.get("entities", {}),
+                    original_query=user_input,
+                    language_detected=row.get("language_detected", detected_lang),
+                    raw_response=json.dumps(row)
+                )
+            except (TypeError, ValueError, AttributeError):
+                quick_intent = self._quick_classify(user_input)
+                result = IntentResult(
+                    intent=quick_intent or Intent.UNKNOWN,
+                    confidence=0.6 if quick_intent else 0.0,
+                    original_query=user_input,
+                    language_detected=detected_lang
+                )
+
+            results.append(result)
+
+        return results
+
     def get_sub_intents(self, intent: Intent) -> List[str]:
         """Get available sub-intents for a given intent category."""
         sub_intents = {
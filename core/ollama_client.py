@@ -85,11 +85,12 @@ class OllamaClient:
         system_prompt: Optional[str] = None,
         temperature: float = 0.1,
         max_tokens: int = 500,
-        stream: bool = False
+        stream: bool = False,
+        json_mode: bool = False
     ) -> str:
         """
         Generate a response from the model.
-        
+
         Args:
             prompt: User prompt
             model: Model to use (default: instance model)
@@ -97,7 +98,9 @@ class OllamaClient:
             temperature: Sampling temperature
             max_tokens: Max tokens in response
             stream: Whether to stream (not implemented yet)
-            
+            json_mode: Constrain output to valid JSON (Ollama format=json),
+                so callers can json.loads the response directly
+
         Returns:
             Generated text
         """
@@ -119,7 +122,10 @@ class OllamaClient:
                 "num_predict": max_tokens,
             }
         }
-        
+
+        if json_mode:
+            payload["format"] = "json"
+
         try:
             response = requests.post(
                 f"{self.base_url}/api/generate",
@@ -144,17 +150,19 @@ class OllamaClient:
         messages: list,
         model: Optional[str] = None,
         temperature: float = 0.1,
-        max_tokens: int = 500
+        max_tokens: int = 500,
+        json_mode: bool = False
     ) -> str:
         """
         Chat completion (multi-turn).
-        
+
         Args:
             messages: List of {"role": "user/assistant/system", "content": "..."}
             model: Model to use
             temperature: Sampling temperature
             max_tokens: Max tokens
-            
+            json_mode: Constrain output to valid JSON (Ollama format=json)
+
         Returns:
             Assistant response
         """
@@ -169,7 +177,10 @@ class OllamaClient:
                 "num_predict": max_tokens,
             }
         }
-        
+
+        if json_mode:
+            payload["format"] = "json"
+
         try:
             response = requests.post(
                 f"{self.base_url}/api/chat",
@@ -3,11 +3,13 @@ OpenRouter API Client for VoxNav
 Uses OpenRouter's free tier for LLM access with automatic fallback.
 """
 
+import asyncio
 import os
 import json
 import logging
+import threading
 import time
-from typing import Optional, Dict, Any, Generator
+from typing import Optional, Dict, Any, Generator, List, Tuple
 
 import requests
 
@@ -25,6 +27,82 @@ FREE_MODELS = [
 DEFAULT_MODEL = FREE_MODELS[0]
 
 
+class _BraceTracker:
+    """Tracks when a streamed top-level JSON object becomes balanced."""
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.started = False
+        self.count = 0  # chars consumed across all chunks
+
+    def feed(self, chunk: str) -> Optional[int]:
+        """Consume a chunk; return the global end offset once balanced."""
+        for ch in chunk:
+            self.count += 1
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == '\\':
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == '{':
+                self.depth += 1
+                self.started = True
+            elif ch == '}':
+                self.depth -= 1
+                if self.started and self.depth == 0:
+                    return self.count
+        return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with monotonic refill.
+
+    Metering requests before they go out prevents provider-side 429s
+    (and the retry/fallback churn they trigger) instead of reacting to them.
+    """
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = float(capacity)
+        self.refill_per_sec = float(refill_per_sec)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_sec)
+        self.updated = now
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """Block until `amount` tokens are available, then take them."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) / self.refill_per_sec
+            time.sleep(wait)
+
+    async def acquire_async(self, amount: float = 1.0) -> None:
+        """Async variant - yields to the event loop while waiting."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) / self.refill_per_sec
+            await asyncio.sleep(wait)
+
+
 class OpenRouterClient:
     """
     OpenRouter API client for VoxNav.
@@ -51,8 +129,37 @@ class OpenRouterClient:
             "X-Title": "VoxNav Voice Assistant"
         }
         
+        # Proactive throttling: meter both requests/min and tokens/min so
+        # bursts queue locally instead of bouncing off provider 429s
+        self._rpm_bucket = TokenBucket(capacity=60, refill_per_sec=1.0)
+        self._tpm_bucket = TokenBucket(capacity=60000, refill_per_sec=1000.0)
+
+        # Lazily created httpx.AsyncClient for the async path
+        self._async_client = None
+
+        # Shared session so the TLS connection is kept alive and reused
+        # across calls instead of re-handshaking on every request
+        self._session = requests.Session()
+
         logger.info("OpenRouter client initialized successfully.")
-    
+
+    def preconnect(self) -> None:
+        """
+        Warm up the connection to OpenRouter in a background thread.
+
+        Performs the TCP + TLS handshake ahead of the first real call so
+        the first extraction of a session doesn't pay connection-setup
+        latency. Failures are ignored - generate() simply connects on
+        demand as before.
+        """
+        def _warm():
+            try:
+                self._session.get(f"{self.BASE_URL}/models", headers=self.headers, timeout=10)
+            except Exception:
+                pass
+
+        threading.Thread(target=_warm, daemon=True, name="openrouter-preconnect").start()
+
     def generate(
         self,
         prompt: str,
@@ -60,11 +167,12 @@ class OpenRouterClient:
         system_prompt: Optional[str] = None,
         temperature: float = 0.3,
         max_tokens: int = 1024,
-        stream: bool = False
+        stream: bool = False,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Generate a response with automatic model fallback on rate limits.
-        
+
         Args:
             prompt: User prompt/message
             model: Primary model to use
@@ -72,7 +180,9 @@ class OpenRouterClient:
             temperature: Sampling temperature (0.0-2.0)
             max_tokens: Maximum output tokens
             stream: Whether to stream the response
-            
+            response_format: Optional structured-output spec
+                (e.g. {"type": "json_object"}) forwarded to the API
+
         Returns:
             Generated text response
         """
@@ -82,7 +192,12 @@ class OpenRouterClient:
             messages.append({"role": "system", "content": system_prompt})
         
         messages.append({"role": "user", "content": prompt})
-        
+
+        # Rough estimate: ~4 chars per prompt token plus the output budget
+        est_tokens = len(prompt) // 4 + max_tokens
+        self._rpm_bucket.acquire(1)
+        self._tpm_bucket.acquire(est_tokens)
+
         # Try primary model first, then fallbacks
         models_to_try = [model] + [m for m in FREE_MODELS if m != model]
         last_error = None
@@ -95,7 +210,10 @@ class OpenRouterClient:
                 "max_tokens": max_tokens,
                 "stream": stream
             }
-            
+
+            if response_format:
+                payload["response_format"] = response_format
+
             try:
                 if stream:
                     return self._generate_stream(payload)
@@ -122,9 +240,186 @@ class OpenRouterClient:
         logger.error(f"All {len(models_to_try)} models failed!")
         raise Exception(f"All free models are unavailable. Please wait and try again. Last error: {last_error}")
     
+    def generate_json(
+        self,
+        prompt: str,
+        model: str = DEFAULT_MODEL,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 1024
+    ) -> str:
+        """
+        Stream a JSON reply and stop as soon as the top-level object closes.
+
+        Extraction-style replies usually come in well under the max_tokens
+        budget; closing the stream at the balancing '}' saves the tail
+        latency of the unused budget instead of waiting for the model to
+        finish. Falls back across FREE_MODELS like generate.
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        est_tokens = len(prompt) // 4 + max_tokens
+        self._rpm_bucket.acquire(1)
+        self._tpm_bucket.acquire(est_tokens)
+
+        models_to_try = [model] + [m for m in FREE_MODELS if m != model]
+        last_error = None
+
+        for i, try_model in enumerate(models_to_try):
+            payload = {
+                "model": try_model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "stream": True
+            }
+
+            try:
+                response = self._session.post(
+                    f"{self.BASE_URL}/chat/completions",
+                    headers=self.headers,
+                    json=payload,
+                    stream=True,
+                    timeout=120
+                )
+
+                if response.status_code != 200:
+                    raise Exception(f"OpenRouter API error: {response.status_code}")
+
+                tracker = _BraceTracker()
+                parts = []
+
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    line = line.decode('utf-8')
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    try:
+                        chunk = json.loads(data)
+                        content = chunk["choices"][0]["delta"].get("content", "")
+                    except json.JSONDecodeError:
+                        continue
+                    if not content:
+                        continue
+
+                    parts.append(content)
+                    end = tracker.feed(content)
+                    if end is not None:
+                        # Object balanced - no need for the remaining tokens
+                        response.close()
+                        if i > 0:
+                            logger.info(f"Fallback succeeded with model: {try_model}")
+                        return ''.join(parts)[:end]
+
+                return ''.join(parts)
+
+            except Exception as e:
+                last_error = e
+                error_str = str(e).lower()
+
+                if any(x in str(e) for x in ["429", "408", "404"]) or "rate" in error_str or "timeout" in error_str:
+                    logger.warning(f"Model {try_model} unavailable, trying next...")
+                    time.sleep(0.5)
+                    continue
+                else:
+                    raise
+
+        logger.error(f"All {len(models_to_try)} models failed!")
+        raise Exception(f"All free models are unavailable. Please wait and try again. Last error: {last_error}")
+
+    async def generate_async(
+        self,
+        prompt: str,
+        model: str = DEFAULT_MODEL,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 1024,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Async generation with the same model-fallback behavior as generate.
+
+        Uses a shared httpx.AsyncClient so the event loop is never blocked on
+        the HTTP round-trip; when httpx isn't installed, the sync path runs
+        in a worker thread instead.
+        """
+        try:
+            import httpx
+        except ImportError:
+            return await asyncio.to_thread(
+                self.generate, prompt, model=model, system_prompt=system_prompt,
+                temperature=temperature, max_tokens=max_tokens,
+                response_format=response_format
+            )
+
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        est_tokens = len(prompt) // 4 + max_tokens
+        await self._rpm_bucket.acquire_async(1)
+        await self._tpm_bucket.acquire_async(est_tokens)
+
+        if self._async_client is None:
+            # Pooled keep-alive connections: concurrent classify sweeps
+            # reuse warm TLS sessions instead of re-handshaking per call
+            self._async_client = httpx.AsyncClient(
+                timeout=120,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8)
+            )
+
+        models_to_try = [model] + [m for m in FREE_MODELS if m != model]
+        last_error = None
+
+        for i, try_model in enumerate(models_to_try):
+            payload = {
+                "model": try_model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens
+            }
+            if response_format:
+                payload["response_format"] = response_format
+
+            try:
+                response = await self._async_client.post(
+                    f"{self.BASE_URL}/chat/completions",
+                    headers=self.headers,
+                    json=payload
+                )
+                if response.status_code != 200:
+                    raise Exception(f"OpenRouter API error: {response.status_code} - {response.text}")
+
+                result = response.json()
+                if i > 0:
+                    logger.info(f"Fallback succeeded with model: {try_model}")
+                return result["choices"][0]["message"]["content"]
+
+            except Exception as e:
+                last_error = e
+                error_str = str(e).lower()
+
+                if any(x in str(e) for x in ["429", "408", "404"]) or "rate" in error_str or "timeout" in error_str:
+                    logger.warning(f"Model {try_model} unavailable, trying next...")
+                    await asyncio.sleep(0.5)
+                    continue
+                else:
+                    raise
+
+        logger.error(f"All {len(models_to_try)} models failed!")
+        raise Exception(f"All free models are unavailable. Please wait and try again. Last error: {last_error}")
+
     def _generate_sync(self, payload: Dict[str, Any]) -> str:
         """Synchronous generation."""
-        response = requests.post(
+        response = self._session.post(
             f"{self.BASE_URL}/chat/completions",
             headers=self.headers,
             json=payload,
@@ -140,7 +435,7 @@ class OpenRouterClient:
     
     def _generate_stream(self, payload: Dict[str, Any]) -> Generator[str, None, None]:
         """Streaming generation."""
-        response = requests.post(
+        response = self._session.post(
             f"{self.BASE_URL}/chat/completions",
             headers=self.headers,
             json=payload,
@@ -190,6 +485,82 @@ class OpenRouterClient:
         return self._generate_sync(payload)
 
 
+class AsyncMicroBatcher:
+    """
+    Micro-batching scheduler for concurrent OpenRouter calls.
+
+    Concurrent callers `await submit(prompt, ...)` and get a future each.
+    A background drain task collects requests for up to `max_wait_ms` (or
+    until `max_batch` are queued) and issues them together, amortizing the
+    per-call scheduling overhead when many users hit the API at once.
+    OpenRouter has no true batch endpoint, so the batch is dispatched as
+    one `asyncio.gather` over thread-offloaded `generate` calls.
+    """
+
+    def __init__(
+        self,
+        client: Optional[OpenRouterClient] = None,
+        max_batch: int = 8,
+        max_wait_ms: int = 20
+    ):
+        self.client = client
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+
+    def _ensure_running(self):
+        """Create the queue and drain task lazily, on the running loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def submit(self, prompt: str, **kwargs) -> str:
+        """Queue a generation request and wait for its result."""
+        self._ensure_running()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, kwargs, future))
+        return await future
+
+    async def _drain(self):
+        """Collect requests into batches and dispatch them together."""
+        while True:
+            batch: List[Tuple[str, Dict[str, Any], asyncio.Future]] = [await self._queue.get()]
+
+            # Collect more requests until the batch is full or the window closes
+            deadline = asyncio.get_running_loop().time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch):
+        """Issue one batch of requests concurrently and resolve the futures."""
+        if self.client is None:
+            self.client = get_client()
+
+        results = await asyncio.gather(
+            *[self.client.generate_async(prompt, **kwargs)
+              for prompt, kwargs, _ in batch],
+            return_exceptions=True
+        )
+
+        for (_, _, future), result in zip(batch, results):
+            if future.cancelled():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
 # Singleton instance
 _client: Optional[OpenRouterClient] = None
 
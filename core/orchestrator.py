@@ -4,6 +4,10 @@ VoxNav Orchestrator - Main entry point that coordinates all components.
 
 import json
 import logging
+import os
+import re
+import threading
+from collections import defaultdict
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
@@ -12,11 +16,44 @@ from .intent_dispatcher import IntentDispatcher, Intent, IntentResult
 from .slot_filler import SlotFiller, SlotResult, SlotStatus
 from .dynamic_prompts import DynamicPromptBuilder
 from .multilingual import MultilingualHandler, Language
+from .openrouter_client import OpenRouterClient
 
 logger = logging.getLogger(__name__)
 
+_TITLE_RE = re.compile(r'<title>(.*?)</title>', re.IGNORECASE | re.DOTALL)
 
-@dataclass
+
+# Keywords that identify CANCEL/HELP without any LLM call. These intents are
+# trivially detectable from a small multilingual vocabulary, so matching them
+# locally skips the classification round-trip entirely.
+_FAST_INTENT_KEYWORDS = {
+    Intent.CANCEL: [
+        "cancel", "abort", "band karo", "ruk jao", "rehne do", "mat karo",
+        "रद्द", "कैंसिल", "रुक जाओ", "मत करो",
+    ],
+    Intent.HELP: [
+        "help", "madad", "sahayata", "kya kar sakte",
+        "मदद", "सहायता", "क्या कर सकते",
+    ],
+}
+
+# One compiled alternation per intent - a single scan over the input instead
+# of N substring checks
+_FAST_INTENT_PATTERNS = [
+    (intent, re.compile(r'\b(?:' + '|'.join(re.escape(kw) for kw in keywords) + r')\b', re.IGNORECASE))
+    for intent, keywords in _FAST_INTENT_KEYWORDS.items()
+]
+
+
+def _fast_intent(text: str) -> Optional[Intent]:
+    """Match trivially detectable intents (CANCEL/HELP) without the LLM."""
+    for intent, pattern in _FAST_INTENT_PATTERNS:
+        if pattern.search(text):
+            return intent
+    return None
+
+
+@dataclass(slots=True)
 class VoxNavResponse:
     """Response from VoxNav processing."""
     
@@ -66,7 +103,11 @@ class VoxNavResponse:
         }
     
     def to_json(self) -> str:
-        """Convert to JSON string."""
+        """Convert to compact JSON string (machine-consumed responses)."""
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':'))
+
+    def to_json_pretty(self) -> str:
+        """Convert to indented JSON string for debugging/logging."""
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
 
 
@@ -108,8 +149,11 @@ class VoxNavOrchestrator:
         self.prompt_builder = DynamicPromptBuilder()
         self.multilingual = MultilingualHandler(api_key=openrouter_api_key)
         
-        # User sessions
+        # User sessions. Per-user locks serialize turns from the same user
+        # (who could otherwise corrupt awaiting_slot state when called from
+        # multiple threads) while unrelated users run fully in parallel.
         self.sessions: Dict[str, Dict] = {}
+        self._session_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
         
         # OpenRouter client for general responses
         self.openrouter_client = None
@@ -126,10 +170,7 @@ class VoxNavOrchestrator:
         """Ensure OpenRouter client is loaded."""
         if self.openrouter_client is not None:
             return
-            
-        from .openrouter_client import OpenRouterClient
-        import os
-        
+
         api_key = self.openrouter_api_key or os.getenv("OPENROUTER_API_KEY")
         if not api_key:
             raise ValueError("OpenRouter API key not provided. Set OPENROUTER_API_KEY env variable.")
@@ -181,6 +222,61 @@ class VoxNavOrchestrator:
                 language='en'
             )
     
+    def process_audio_batch(
+        self,
+        audio_inputs: list,
+        user_id: str,
+        current_url: Optional[str] = None,
+        page_html: Optional[str] = None,
+        language: Optional[str] = None,
+        batch_size: int = 16
+    ) -> list:
+        """
+        Process several audio inputs, transcribing them as one ASR batch.
+
+        All inputs go through a single padded transcription pass (see
+        ASREngine.transcribe_batch) before the per-utterance text
+        processing, so N clips cost one model invocation instead of N.
+
+        Args:
+            audio_inputs: List of audio file paths, bytes, or numpy arrays
+            user_id: Unique user identifier
+            current_url: Current webpage URL (for context)
+            page_html: Current page HTML (for context)
+            language: Language hint for ASR
+            batch_size: ASR inference batch size (config.asr.batch_size)
+
+        Returns:
+            List of VoxNavResponse, one per input, in order
+        """
+        try:
+            asr_results = self.asr.transcribe_batch(
+                audio_inputs, language=language, batch_size=batch_size
+            )
+        except Exception as e:
+            logger.error(f"Batch audio processing failed: {e}")
+            return [
+                VoxNavResponse(
+                    response_type='error',
+                    message="Sorry, I couldn't process that audio. Please try again.",
+                    language='en'
+                )
+                for _ in audio_inputs
+            ]
+
+        responses = []
+        for asr_result in asr_results:
+            transcription = asr_result['text']
+            logger.info(f"Transcription: {transcription}")
+            responses.append(self.process_text(
+                text_input=transcription,
+                user_id=user_id,
+                current_url=current_url,
+                page_html=page_html,
+                transcription=transcription
+            ))
+        return responses
+
     def process_text(
         self,
         text_input: str,
@@ -209,53 +305,64 @@ class VoxNavOrchestrator:
             
             logger.info(f"Detected language: {detected_lang.value}")
             
-            # Step 2: Check if we're in the middle of slot filling
-            session = self.sessions.get(user_id)
-            
-            if session and session.get('awaiting_slot'):
-                # Continue slot filling
-                return self._continue_slot_filling(
-                    text_input, user_id, session, detected_lang,
-                    current_url, page_html, transcription
-                )
-            
-            # Step 3: Classify intent
-            context = {}
-            if current_url:
-                context['url'] = current_url
-            if page_html:
-                context['page_title'] = self._extract_title(page_html)
-            
-            intent_result = self.intent_dispatcher.classify(text_input, context)
-            
-            logger.info(f"Intent: {intent_result.intent.value}, Confidence: {intent_result.confidence}")
-            
-            # Step 4: Handle based on intent
-            if intent_result.intent == Intent.BOOKING:
-                return self._handle_booking(
-                    text_input, user_id, intent_result, detected_lang,
-                    current_url, page_html, transcription
-                )
-            
-            elif intent_result.intent == Intent.SEARCH:
-                return self._handle_search(
-                    text_input, user_id, intent_result, detected_lang,
-                    current_url, transcription
-                )
-            
-            elif intent_result.intent == Intent.CANCEL:
-                return self._handle_cancel(user_id, detected_lang, transcription)
-            
-            elif intent_result.intent == Intent.HELP:
-                return self._handle_help(detected_lang, transcription)
-            
-            else:
-                # General response
-                return self._handle_general(
-                    text_input, intent_result, detected_lang,
-                    current_url, page_html, transcription
-                )
-                
+            # Steps 2-4 read and write session state, so they run under the
+            # user's lock - interleaved turns from one user stay ordered
+            with self._session_locks[user_id]:
+                # Step 2: Check if we're in the middle of slot filling
+                session = self.sessions.get(user_id)
+
+                if session and session.get('awaiting_slot'):
+                    # Continue slot filling
+                    return self._continue_slot_filling(
+                        text_input, user_id, session, detected_lang,
+                        current_url, page_html, transcription
+                    )
+
+                # Step 3: Classify intent - CANCEL/HELP are caught by the local
+                # keyword scan first so they never pay for an LLM round-trip
+                fast_intent = _fast_intent(text_input)
+                if fast_intent == Intent.CANCEL:
+                    return self._handle_cancel(user_id, detected_lang, transcription)
+                if fast_intent == Intent.HELP:
+                    return self._handle_help(detected_lang, transcription)
+
+                context = {}
+                if current_url:
+                    context['url'] = current_url
+                if page_html:
+                    context['page_title'] = self._extract_title(page_html)
+
+                intent_result = self.intent_dispatcher.classify(text_input, context)
+
+                logger.info(f"Intent: {intent_result.intent.value}, Confidence: {intent_result.confidence}")
+
+                # Step 4: Handle based on intent
+                if intent_result.intent == Intent.BOOKING:
+                    return self._handle_booking(
+                        text_input, user_id, intent_result, detected_lang,
+                        current_url, page_html, transcription
+                    )
+
+                elif intent_result.intent == Intent.SEARCH:
+                    return self._handle_search(
+                        text_input, user_id, intent_result, detected_lang,
+                        current_url, transcription
+                    )
+
+                elif intent_result.intent == Intent.CANCEL:
+                    return self._handle_cancel(user_id, detected_lang, transcription)
+
+                elif intent_result.intent == Intent.HELP:
+                    return self._handle_help(detected_lang, transcription)
+
+                else:
+                    # General response
+                    return self._handle_general(
+                        text_input, intent_result, detected_lang,
+                        current_url, page_html, transcription
+                    )
+
+
         except Exception as e:
             logger.error(f"Text processing failed: {e}")
             return VoxNavResponse(
@@ -268,8 +375,7 @@ class VoxNavOrchestrator:
     def _extract_title(self, html: str) -> str:
         """Extract title from HTML."""
         try:
-            import re
-            match = re.search(r'<title>(.*?)</title>', html, re.IGNORECASE | re.DOTALL)
+            match = _TITLE_RE.search(html)
             return match.group(1).strip() if match else ''
         except:
             return ''
@@ -287,14 +393,16 @@ class VoxNavOrchestrator:
         """Handle booking intent."""
         
         sub_intent = intent_result.sub_intent or 'train_ticket'
-        
-        # Try to extract slots
+
+        # The classify call already extracted entities, so reuse them here
+        # instead of making a second LLM round-trip for slot extraction
         slot_result = self.slot_filler.extract_slots(
             user_id=user_id,
             user_input=text_input,
             intent="BOOKING",
             sub_intent=sub_intent,
-            language=detected_lang.value
+            language=detected_lang.value,
+            pre_extracted=intent_result.entities or {}
         )
         
         if slot_result.status == SlotStatus.COMPLETE:
@@ -362,10 +470,16 @@ class VoxNavOrchestrator:
                 current_url, page_html, transcription
             )
         else:
-            # Still need more
-            self.sessions[user_id]['awaiting_slot'] = slot_result.next_slot
-            self.sessions[user_id]['filled_slots'] = slot_result.filled_slots
-            
+            # Still need more - build the updated session once and write it
+            # atomically (one store, and a single round-trip if the session
+            # store ever moves to Redis)
+            self.sessions[user_id] = {
+                'intent': session['intent'],
+                'sub_intent': session['sub_intent'],
+                'awaiting_slot': slot_result.next_slot,
+                'filled_slots': slot_result.filled_slots
+            }
+
             return VoxNavResponse(
                 response_type='question',
                 message=slot_result.next_question or "Please provide more details.",
@@ -640,3 +754,4 @@ Respond helpfully and concisely."""
         if user_id in self.sessions:
             del self.sessions[user_id]
         self.slot_filler.clear_session(user_id)
+        self._session_locks.pop(user_id, None)
@@ -5,16 +5,39 @@ Asks follow-up questions when required information is missing.
 
 import json
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+import re
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
-class SlotStatus(Enum):
-    """Status of slot filling process."""
+class SlotStatus(str, Enum):
+    """Status of slot filling process.
+
+    Subclasses str so members are plain interned strings at runtime:
+    equality checks and dict hashing cost a string compare instead of
+    Enum machinery, and `status == "complete"` works for consumers.
+    """
     COMPLETE = "complete"
     INCOMPLETE = "incomplete"
     FAILED = "failed"
@@ -179,61 +202,434 @@ SLOT_DEFINITIONS = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class SubIntentSpec:
+    """Immutable, precomputed slot spec for one (intent, sub_intent) pair.
+
+    Tuples and pre-joined strings are computed once at import time so the
+    per-turn path never re-hashes the nested SLOT_DEFINITIONS dicts or
+    re-joins the slot lists.
+    """
+    required: Tuple[str, ...]
+    optional: Tuple[str, ...]
+    required_joined: str
+    optional_joined: str
+    prompts: Mapping[str, Mapping[str, str]]
+
+
+def _build_slot_table() -> Dict[Tuple[str, str], SubIntentSpec]:
+    table = {}
+    for intent, sub_intents in SLOT_DEFINITIONS.items():
+        for sub_intent, config in sub_intents.items():
+            required = tuple(config['required'])
+            optional = tuple(config.get('optional', ()))
+            table[(intent, sub_intent)] = SubIntentSpec(
+                required=required,
+                optional=optional,
+                required_joined=', '.join(required),
+                optional_joined=', '.join(optional),
+                prompts=MappingProxyType({
+                    slot: MappingProxyType(dict(by_lang))
+                    for slot, by_lang in config.get('prompts', {}).items()
+                })
+            )
+    return table
+
+
+_SLOT_TABLE: Dict[Tuple[str, str], SubIntentSpec] = _build_slot_table()
+
+
+def _build_next_questions() -> Dict[Tuple[str, str, str, str], str]:
+    """Flatten follow-up questions per (intent, sub_intent, slot, lang).
+
+    The hi -> en and hinglish -> en fallbacks are resolved here once, so the
+    per-turn lookup is a single dict.get instead of a chain of prompt gets.
+    """
+    table = {}
+    for (intent, sub_intent), spec in _SLOT_TABLE.items():
+        for slot in spec.required + spec.optional:
+            prompts = spec.prompts.get(slot, {})
+            english = prompts.get('en')
+            for lang in ('en', 'hi', 'hinglish'):
+                question = prompts.get(lang, english) or english
+                if question:
+                    table[(intent, sub_intent, slot, lang)] = question
+    return table
+
+
+_NEXT_QUESTIONS: Dict[Tuple[str, str, str, str], str] = _build_next_questions()
+
+
+# Extraction prompt scaffold. The constant portions (slot lists,
+# instructions) are pre-formatted once per (intent, sub_intent) at import
+# time; only {filled_slots} and {user_input} are filled per turn.
+_PROMPT_SCAFFOLD = """Extract information from the user's message to fill the following slots.
+
+REQUIRED SLOTS: {required}
+OPTIONAL SLOTS: {optional}
+
+ALREADY FILLED: {{filled_slots}}
+
+USER MESSAGE: "{{user_input}}"
+
+INSTRUCTIONS:
+1. Extract only values explicitly mentioned by the user
+2. Normalize dates (e.g., "tomorrow" -> actual date, "next Monday" -> actual date)
+3. Keep location names as-is (in original language/script)
+4. Return null for slots not mentioned
+
+Respond with valid JSON only:
+{{{{"source": "value or null", "destination": "value or null", "date": "YYYY-MM-DD or relative term", ...}}}}
+"""
+
+_PROMPT_TEMPLATES: Dict[Tuple[str, str], str] = {
+    key: _PROMPT_SCAFFOLD.format(
+        required=spec.required_joined,
+        optional=spec.optional_joined
+    )
+    for key, spec in _SLOT_TABLE.items()
+}
+
+
+# --- Fast-path extractors for trivial follow-up answers ---------------------
+# Mid-conversation replies are mostly single tokens ("Delhi", "3", "kal")
+# that don't need an LLM. Each extractor returns the slot value or None.
+
+_CITIES = frozenset([
+    "delhi", "mumbai", "bangalore", "bengaluru", "chennai", "kolkata",
+    "hyderabad", "pune", "ahmedabad", "jaipur", "goa", "lucknow", "surat",
+    "kanpur", "nagpur", "indore", "patna", "bhopal", "agra", "varanasi",
+    "chandigarh", "kochi", "amritsar", "guwahati", "bhubaneswar",
+    "दिल्ली", "मुंबई", "जयपुर", "कोलकाता", "चेन्नई", "पुणे", "आगरा",
+])
+
+_FILLER_TOKENS = frozenset(["se", "from", "to", "ko", "mein", "me", "in"])
+
+_RELATIVE_DATES = frozenset([
+    "today", "tomorrow", "day after tomorrow",
+    "aaj", "kal", "parso", "आज", "कल", "परसों",
+])
+
+_FAST_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}|\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?")
+
+# Strips a ```json ... ``` fence in one pass instead of three string slices
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.S)
+
+# Relative date keyword -> day offset, replacing the chained if/elif
+# membership checks with one dict lookup per field
+_DATE_OFFSETS = {
+    "today": 0, "aaj": 0, "आज": 0,
+    "tomorrow": 1, "kal": 1, "कल": 1,
+    "day after tomorrow": 2, "parso": 2, "परसों": 2,
+}
+# No trailing \b: "next weekend" should match too, like the old
+# substring check did
+_NEXT_WEEK_RE = re.compile(r"\bnext\s+week")
+_DATE_FIELDS = ('date', 'checkin_date', 'checkout_date', 'return_date', 'travel_date')
+
+
+def _get_slot_config(intent: str, sub_intent: str) -> Optional[SubIntentSpec]:
+    """Resolve an (intent, sub_intent) pair to its precomputed spec.
+
+    The flat _SLOT_TABLE makes this a single hash lookup, so the lru_cache
+    that previously memoized the nested-dict traversal is no longer needed.
+    """
+    return _SLOT_TABLE.get((intent, sub_intent))
+_FAST_INT_RE = re.compile(r"\s*(\d{1,2})(?:\s*(?:passengers?|guests?|rooms?|log|yatri))?\s*")
+
+
+def _fast_city(text: str) -> Optional[str]:
+    """Match a bare city name, ignoring filler words like 'se'/'from'."""
+    tokens = [t for t in re.split(r"[\s,]+", text.strip().lower())
+              if t and t not in _FILLER_TOKENS]
+    if len(tokens) == 1 and tokens[0] in _CITIES:
+        return tokens[0].title()
+    return None
+
+
+def _fast_date(text: str) -> Optional[str]:
+    """Match relative date keywords or an explicit date."""
+    value = text.strip().lower()
+    if value in _RELATIVE_DATES or 'next week' in value:
+        return value
+    match = _FAST_DATE_RE.search(value)
+    return match.group() if match else None
+
+
+def _fast_int(text: str) -> Optional[str]:
+    """Match a small count, optionally suffixed ('3 passengers')."""
+    match = _FAST_INT_RE.fullmatch(text.strip().lower())
+    return match.group(1) if match else None
+
+
+def _fast_class(text: str) -> Optional[str]:
+    """Match a travel-class mention."""
+    lower = text.lower()
+    return next((c for c in ("sleeper", "3ac", "2ac", "1ac", "general", "ac")
+                 if c in lower), None)
+
+
+_FAST_EXTRACTORS = {
+    "source": _fast_city,
+    "destination": _fast_city,
+    "location": _fast_city,
+    "pickup": _fast_city,
+    "drop": _fast_city,
+    "date": _fast_date,
+    "checkin_date": _fast_date,
+    "checkout_date": _fast_date,
+    "return_date": _fast_date,
+    "passengers": _fast_int,
+    "guests": _fast_int,
+    "rooms": _fast_int,
+    "class": _fast_class,
+}
+
+
+class TTLCache:
+    """
+    LRU mapping with per-entry TTL, used to bound session memory.
+
+    Entries expire after `ttl` seconds of inactivity and the oldest entry is
+    dropped once `max_entries` is exceeded, so abandoned conversations can't
+    leak memory in a long-running server. Eviction is lazy: stale entries at
+    the front are popped on each access.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 900.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        while self._data:
+            key, (last_touch, _) = next(iter(self._data.items()))
+            if now - last_touch > self.ttl or len(self._data) > self.max_entries:
+                del self._data[key]
+            else:
+                break
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self._evict()
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        last_touch, value = entry
+        if time.monotonic() - last_touch > self.ttl:
+            del self._data[key]
+            return default
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        self._evict()
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __len__(self) -> int:
+        self._evict()
+        return len(self._data)
+
+
 class SlotFiller:
     """
     Manages slot filling for multi-turn conversations.
     Extracts required information and asks follow-up questions.
     """
     
+    # Exact-match cache for extraction LLM calls: identical
+    # (sub_intent, filled_slots, input) triples skip the network entirely
+    _CACHE_MAX = 1024
+    _CACHE_TTL = 3600.0  # seconds
+
+    # Semantic cache: near-duplicate phrasings ("when do I leave" /
+    # "travel date?") reuse a prior extraction when cosine similarity
+    # exceeds the threshold. Requires sentence-transformers + numpy;
+    # silently disabled when they aren't installed.
+    _SEM_THRESHOLD = 0.92
+    _SEM_MAX = 512  # entries per (sub_intent, slot-signature) partition
+
+    # One OpenRouter client shared by all instances: instantiating a
+    # SlotFiller per request must not cost an import + env lookup + fresh
+    # connection pool each time
+    _shared_client = None
+    _client_lock = threading.Lock()
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the Slot Filler.
-        
+
         Args:
             api_key: OpenRouter API key
         """
         self.api_key = api_key
         self.client = None
-        self.sessions: Dict[str, Dict] = {}  # user_id -> session state
-        
+        # user_id -> session state; TTL-bounded so stale sessions from
+        # abandoned conversations can't grow memory without bound
+        self.sessions = TTLCache(max_entries=10000, ttl=900.0)
+        self._extract_cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # partition key -> (embedding matrix, list of cached extractions)
+        self._sem_index: Dict[tuple, Tuple[Any, List[Dict[str, Any]]]] = {}
+        self._embedder = None  # None = not tried, False = unavailable
+        self._batcher = None  # shared AsyncMicroBatcher for the async path
+        # sub_intent -> local extraction model (see register_local_extractor)
+        self._local_extractors: Dict[str, Any] = {}
+
+    def _cache_key(self, sub_intent: str, filled_slots: Dict[str, Any], user_input: str) -> tuple:
+        """Build the exact-match cache key for an extraction call."""
+        return (
+            sub_intent,
+            json.dumps(sorted(filled_slots.items()), ensure_ascii=False),
+            user_input.strip().lower()
+        )
+
+    def _cache_get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Look up a cached extraction, evicting the entry if expired."""
+        entry = self._extract_cache.get(key)
+        if entry is None:
+            return None
+        timestamp, extracted = entry
+        if time.monotonic() - timestamp > self._CACHE_TTL:
+            del self._extract_cache[key]
+            return None
+        self._extract_cache.move_to_end(key)
+        return extracted
+
+    def _cache_put(self, key: tuple, extracted: Dict[str, Any]) -> None:
+        """Store an extraction result, evicting oldest entries past capacity."""
+        self._extract_cache[key] = (time.monotonic(), dict(extracted))
+        self._extract_cache.move_to_end(key)
+        while len(self._extract_cache) > self._CACHE_MAX:
+            self._extract_cache.popitem(last=False)
+
+    def _ensure_embedder(self):
+        """Load the sentence embedding model on first use (optional dep)."""
+        if self._embedder is not None:
+            return
+        try:
+            from sentence_transformers import SentenceTransformer
+            self._embedder = SentenceTransformer("all-MiniLM-L6-v2")
+        except ImportError:
+            logger.warning("sentence-transformers not installed, semantic cache disabled")
+            self._embedder = False
+
+    def _embed(self, text: str):
+        """Embed text as a normalized vector, or None if unavailable."""
+        self._ensure_embedder()
+        if self._embedder is False:
+            return None
+        return self._embedder.encode([text], normalize_embeddings=True)[0]
+
+    def _sem_partition(self, sub_intent: str, filled_slots: Dict[str, Any]) -> tuple:
+        """Partition key - caches never cross slot contexts."""
+        return (sub_intent, tuple(sorted(filled_slots)))
+
+    def _semantic_get(self, partition: tuple, query_vec) -> Optional[Dict[str, Any]]:
+        """Return the cached extraction closest to query_vec, if close enough."""
+        if query_vec is None or partition not in self._sem_index:
+            return None
+        matrix, extractions = self._sem_index[partition]
+        sims = matrix @ query_vec  # vectors are normalized, dot = cosine
+        best = int(sims.argmax())
+        if sims[best] >= self._SEM_THRESHOLD:
+            return extractions[best]
+        return None
+
+    def _semantic_put(self, partition: tuple, query_vec, extracted: Dict[str, Any]) -> None:
+        """Add an extraction to the semantic index with FIFO eviction."""
+        if query_vec is None:
+            return
+        import numpy as np
+        if partition in self._sem_index:
+            matrix, extractions = self._sem_index[partition]
+            matrix = np.vstack([matrix, query_vec])
+            extractions = extractions + [dict(extracted)]
+            if len(extractions) > self._SEM_MAX:
+                matrix = matrix[-self._SEM_MAX:]
+                extractions = extractions[-self._SEM_MAX:]
+        else:
+            matrix = query_vec.reshape(1, -1)
+            extractions = [dict(extracted)]
+        self._sem_index[partition] = (matrix, extractions)
+
     def _ensure_client(self):
-        """Ensure OpenRouter client is initialized."""
+        """Ensure OpenRouter client is initialized (shared across instances)."""
         if self.client is not None:
             return
-            
-        from .openrouter_client import OpenRouterClient
-        import os
-        
-        api_key = self.api_key or os.getenv("OPENROUTER_API_KEY")
-        if not api_key:
-            raise ValueError("OpenRouter API key not provided. Set OPENROUTER_API_KEY env variable.")
-        
-        self.client = OpenRouterClient(api_key=api_key)
+
+        with SlotFiller._client_lock:
+            if SlotFiller._shared_client is None:
+                from .openrouter_client import OpenRouterClient
+                import os
+
+                api_key = self.api_key or os.getenv("OPENROUTER_API_KEY")
+                if not api_key:
+                    raise ValueError("OpenRouter API key not provided. Set OPENROUTER_API_KEY env variable.")
+
+                SlotFiller._shared_client = OpenRouterClient(api_key=api_key)
+                # Warm up TCP/TLS in the background so the first real
+                # extraction call doesn't pay connection-setup latency
+                SlotFiller._shared_client.preconnect()
+
+        self.client = SlotFiller._shared_client
     
-    def get_slot_config(self, intent: str, sub_intent: str) -> Optional[Dict]:
+    def get_slot_config(self, intent: str, sub_intent: str) -> Optional[SubIntentSpec]:
         """Get slot configuration for an intent/sub-intent pair."""
-        return SLOT_DEFINITIONS.get(intent, {}).get(sub_intent)
+        return _get_slot_config(intent, sub_intent)
     
-    def _extract_slots_prompt(self, user_input: str, slot_config: Dict, filled_slots: Dict) -> str:
-        """Build prompt for slot extraction."""
-        return f"""Extract information from the user's message to fill the following slots.
+    def _extract_slots_prompt(self, intent: str, sub_intent: str, user_input: str, filled_slots: Dict) -> str:
+        """Build prompt for slot extraction from the precomputed template."""
+        return _PROMPT_TEMPLATES[(intent, sub_intent)].format(
+            filled_slots=_json_dumps(filled_slots),
+            user_input=user_input
+        )
 
-REQUIRED SLOTS: {', '.join(slot_config['required'])}
-OPTIONAL SLOTS: {', '.join(slot_config.get('optional', []))}
+    def register_local_extractor(self, sub_intent: str, extractor) -> None:
+        """
+        Register a local extraction model for a high-volume sub-intent.
+
+        The extractor is a callable taking the raw utterance and returning
+        the extracted slot dict, or None to fall back to OpenRouter. This is
+        the hook for replacing the ~500ms network call with a few ms of CPU
+        inference from a small distilled model (e.g. an int8 ONNX NER
+        fine-tune trained on the cached OpenRouter extractions).
+        """
+        self._local_extractors[sub_intent] = extractor
 
-ALREADY FILLED: {json.dumps(filled_slots)}
+    def _local_extract(self, sub_intent: str, user_input: str) -> Optional[Dict[str, Any]]:
+        """Run the registered local model for this sub-intent, if any."""
+        extractor = self._local_extractors.get(sub_intent)
+        if extractor is None:
+            return None
+        try:
+            return extractor(user_input)
+        except Exception as e:
+            logger.error(f"Local extractor for {sub_intent} failed: {e}")
+            return None
 
-USER MESSAGE: "{user_input}"
+    def _ensure_batcher(self):
+        """Ensure the shared micro-batcher exists (async extraction path)."""
+        if self._batcher is None:
+            from .openrouter_client import AsyncMicroBatcher
+            self._batcher = AsyncMicroBatcher(client=self.client, max_batch=8, max_wait_ms=20)
 
-INSTRUCTIONS:
-1. Extract only values explicitly mentioned by the user
-2. Normalize dates (e.g., "tomorrow" -> actual date, "next Monday" -> actual date)
-3. Keep location names as-is (in original language/script)
-4. Return null for slots not mentioned
+    async def _generate_async(self, prompt: str, **kwargs) -> str:
+        """Generate via the shared micro-batcher.
 
-Respond with valid JSON only:
-{{"source": "value or null", "destination": "value or null", "date": "YYYY-MM-DD or relative term", ...}}
-"""
+        Concurrent users' extraction calls landing within the 20ms window
+        are coalesced and dispatched together instead of one HTTP request
+        per turn, which keeps request count under OpenRouter's RPM limit.
+        """
+        self._ensure_batcher()
+        return await self._batcher.submit(prompt, **kwargs)
 
     async def extract_slots_async(
         self,
@@ -241,34 +637,89 @@ Respond with valid JSON only:
         user_input: str,
         intent: str,
         sub_intent: str,
-        language: str = "en"
+        language: str = "en",
+        pre_extracted: Optional[Dict[str, Any]] = None
     ) -> SlotResult:
-        """Async version of extract_slots."""
-        return self.extract_slots(user_id, user_input, intent, sub_intent, language)
-    
+        """
+        Async version of extract_slots.
+
+        Same flow as the sync path, but the LLM leg goes through the shared
+        AsyncMicroBatcher so concurrent users' extractions are coalesced
+        into one dispatch instead of a request per turn.
+        """
+        slot_config = self.get_slot_config(intent, sub_intent)
+        if not slot_config:
+            return SlotResult(
+                status=SlotStatus.COMPLETE,
+                filled_slots={},
+                missing_slots=[]
+            )
+
+        session = self._get_or_create_session(user_id, intent, sub_intent)
+
+        if pre_extracted is not None:
+            self._merge_extracted(session, pre_extracted)
+        elif (fast := self._fast_extract(slot_config, session['filled_slots'], user_input)) is not None:
+            slot_name, value = fast
+            session['filled_slots'][slot_name] = value
+            session['filled_slots'] = self._normalize_dates(session['filled_slots'])
+        else:
+            self._ensure_client()
+            cache_key = self._cache_key(sub_intent, session['filled_slots'], user_input)
+            extracted = self._cache_get(cache_key)
+
+            partition = query_vec = None
+            if extracted is None:
+                partition = self._sem_partition(sub_intent, session['filled_slots'])
+                query_vec = self._embed(user_input.strip().lower())
+                extracted = self._semantic_get(partition, query_vec)
+
+            if extracted is None:
+                extracted = self._local_extract(sub_intent, user_input)
+
+            if extracted is None:
+                prompt = self._extract_slots_prompt(intent, sub_intent, user_input, session['filled_slots'])
+                try:
+                    raw_text = await self._generate_async(prompt, temperature=0.1, max_tokens=300)
+                    extracted = self._parse_extraction(raw_text)
+                    self._cache_put(cache_key, extracted)
+                    self._semantic_put(partition, query_vec, extracted)
+                except Exception as e:
+                    # _finalize counts the attempt; incrementing here too
+                    # would double-count failed turns
+                    logger.error(f"Slot extraction failed: {e}")
+                    extracted = None
+
+            if extracted is not None:
+                self._merge_extracted(session, extracted)
+
+        return self._finalize(user_id, session, slot_config, language)
+
     def extract_slots(
         self,
         user_id: str,
         user_input: str,
         intent: str,
         sub_intent: str,
-        language: str = "en"
+        language: str = "en",
+        pre_extracted: Optional[Dict[str, Any]] = None
     ) -> SlotResult:
         """
         Extract slots from user input and manage conversation state.
-        
+
         Args:
             user_id: Unique user identifier
             user_input: The user's message
             intent: Intent category (e.g., "BOOKING")
             sub_intent: Sub-intent (e.g., "train_ticket")
             language: User's language for prompts
-            
+            pre_extracted: Entities already extracted upstream (e.g. by the
+                intent classifier). When provided, the extraction LLM call
+                is skipped entirely - one round-trip per turn instead of two.
+
         Returns:
             SlotResult with current slot status and next question if needed
         """
-        self._ensure_client()
-        
         # Get slot configuration
         slot_config = self.get_slot_config(intent, sub_intent)
         if not slot_config:
@@ -277,57 +728,106 @@ Respond with valid JSON only:
                 filled_slots={},
                 missing_slots=[]
             )
-        
-        # Get or create session
-        session = self.sessions.get(user_id, {
+
+        session = self._get_or_create_session(user_id, intent, sub_intent)
+
+        if pre_extracted is not None:
+            # Slots were already extracted in the fused intent+slot LLM call -
+            # just merge them, no second round-trip needed.
+            self._merge_extracted(session, pre_extracted)
+        elif (fast := self._fast_extract(slot_config, session['filled_slots'], user_input)) is not None:
+            # Trivial single-slot answer matched by regex/lexicon - no LLM at all
+            slot_name, value = fast
+            session['filled_slots'][slot_name] = value
+            session['filled_slots'] = self._normalize_dates(session['filled_slots'])
+        else:
+            self._ensure_client()
+
+            # Identical (sub_intent, filled_slots, input) triples hit the
+            # exact-match cache and skip the LLM round-trip entirely
+            cache_key = self._cache_key(sub_intent, session['filled_slots'], user_input)
+            extracted = self._cache_get(cache_key)
+
+            # On exact miss, try the semantic cache for near-duplicate phrasings
+            partition = query_vec = None
+            if extracted is None:
+                partition = self._sem_partition(sub_intent, session['filled_slots'])
+                query_vec = self._embed(user_input.strip().lower())
+                extracted = self._semantic_get(partition, query_vec)
+
+            # A registered local model handles hot sub-intents on-CPU
+            # instead of going over the network
+            if extracted is None:
+                extracted = self._local_extract(sub_intent, user_input)
+
+            if extracted is None:
+                # Build extraction prompt
+                prompt = self._extract_slots_prompt(intent, sub_intent, user_input, session['filled_slots'])
+
+                try:
+                    # Call OpenRouter for extraction - streamed, and cut off
+                    # as soon as the JSON object is balanced
+                    raw_text = self.client.generate_json(
+                        prompt=prompt,
+                        temperature=0.1,
+                        max_tokens=300
+                    )
+
+                    extracted = self._parse_extraction(raw_text)
+                    self._cache_put(cache_key, extracted)
+                    self._semantic_put(partition, query_vec, extracted)
+
+                except Exception as e:
+                    # _finalize counts the attempt; incrementing here too
+                    # would double-count failed turns
+                    logger.error(f"Slot extraction failed: {e}")
+                    extracted = None
+
+            if extracted is not None:
+                self._merge_extracted(session, extracted)
+
+        return self._finalize(user_id, session, slot_config, language)
+
+    def _get_or_create_session(self, user_id: str, intent: str, sub_intent: str) -> Dict:
+        """Fetch the user's session or start a fresh one."""
+        return self.sessions.get(user_id, {
             'intent': intent,
             'sub_intent': sub_intent,
             'filled_slots': {},
             'attempts': 0
         })
-        
-        # Build extraction prompt
-        prompt = self._extract_slots_prompt(user_input, slot_config, session['filled_slots'])
-        
-        try:
-            # Call OpenRouter for extraction
-            raw_text = self.client.generate(
-                prompt=prompt,
-                temperature=0.1,
-                max_tokens=300
-            )
-            
-            raw_text = raw_text.strip()
-            
-            # Clean markdown if present
-            if raw_text.startswith('```'):
-                raw_text = raw_text.split('\n', 1)[1]
-                raw_text = raw_text.rsplit('```', 1)[0]
-            
-            extracted = json.loads(raw_text)
-            
-            # Merge with existing slots
-            for key, value in extracted.items():
-                if value is not None and value != "null":
-                    session['filled_slots'][key] = value
-            
-            # Normalize dates
-            session['filled_slots'] = self._normalize_dates(session['filled_slots'])
-            
-        except Exception as e:
-            logger.error(f"Slot extraction failed: {e}")
-            session['attempts'] += 1
-        
-        # Check which required slots are missing
-        missing = [
-            slot for slot in slot_config['required']
-            if slot not in session['filled_slots'] or not session['filled_slots'][slot]
-        ]
-        
-        # Update session
-        session['attempts'] += 1
+
+    @staticmethod
+    def _parse_extraction(raw_text: str) -> Dict[str, Any]:
+        """Parse an LLM extraction reply, stripping any markdown fence."""
+        match = _FENCE_RE.match(raw_text)
+        return _json_loads(match.group(1) if match else raw_text.strip())
+
+    def _merge_extracted(self, session: Dict, extracted: Dict[str, Any]) -> None:
+        """Merge non-null extracted values into the session and normalize dates."""
+        for key, value in extracted.items():
+            if value is not None and value != "null":
+                session['filled_slots'][key] = value
+        session['filled_slots'] = self._normalize_dates(session['filled_slots'])
+
+    def _finalize(
+        self,
+        user_id: str,
+        session: Dict,
+        slot_config: SubIntentSpec,
+        language: str
+    ) -> SlotResult:
+        """Compute missing slots, persist the session and build the result."""
+        # Local binding avoids re-indexing the session per iteration, and
+        # .get folds the `in` + [] double lookup into one
+        filled = session['filled_slots']
+        missing = tuple(slot for slot in slot_config.required if not filled.get(slot))
+
+        # Update session - single read-modify-write of the attempts counter
+        attempts = session['attempts'] + 1
+        session['attempts'] = attempts
         self.sessions[user_id] = session
-        
+
         if not missing:
             # All slots filled!
             self.clear_session(user_id)
@@ -335,49 +835,73 @@ Respond with valid JSON only:
                 status=SlotStatus.COMPLETE,
                 filled_slots=session['filled_slots'],
                 missing_slots=[],
-                attempts=session['attempts']
+                attempts=attempts
             )
-        
-        # Get next question
+
+        # Get next question from the precomputed per-language table
         next_slot = missing[0]
-        prompts = slot_config['prompts'].get(next_slot, {})
-        
-        # Select language-appropriate prompt
-        if language in ['hi', 'hindi']:
-            next_question = prompts.get('hi', prompts.get('en', f"Please provide {next_slot}"))
-        elif language in ['hinglish']:
-            next_question = prompts.get('hinglish', prompts.get('en', f"Please provide {next_slot}"))
-        else:
-            next_question = prompts.get('en', f"Please provide {next_slot}")
-        
+        lang_key = 'hi' if language in ('hi', 'hindi') else 'hinglish' if language == 'hinglish' else 'en'
+        next_question = _NEXT_QUESTIONS.get(
+            (session['intent'], session['sub_intent'], next_slot, lang_key)
+        ) or f"Please provide {next_slot}"
+
         return SlotResult(
             status=SlotStatus.INCOMPLETE,
             filled_slots=session['filled_slots'],
             missing_slots=missing,
             next_question=next_question,
             next_slot=next_slot,
-            attempts=session['attempts']
+            attempts=attempts
         )
-    
+
+
+    def _fast_extract(
+        self,
+        slot_config: SubIntentSpec,
+        filled_slots: Dict[str, Any],
+        user_input: str
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Try to fill the single awaited slot without the LLM.
+
+        Only fires when exactly one required slot is missing and the reply is
+        short - the typical mid-conversation follow-up answer. Returns
+        (slot_name, value) on success, None to fall through to the LLM.
+        """
+        missing = [s for s in slot_config.required if not filled_slots.get(s)]
+        if len(missing) != 1 or len(user_input.split()) >= 6:
+            return None
+
+        extractor = _FAST_EXTRACTORS.get(missing[0])
+        if extractor is None:
+            return None
+
+        value = extractor(user_input)
+        if value is None:
+            return None
+        return missing[0], value
+
     def _normalize_dates(self, slots: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize relative date expressions to actual dates."""
-        date_fields = ['date', 'checkin_date', 'checkout_date', 'return_date', 'travel_date']
         today = datetime.now()
-        
-        for field in date_fields:
+        formatted: Dict[int, str] = {}  # offset -> date string, one strftime per offset
+
+        for field in _DATE_FIELDS:
             if field in slots and slots[field]:
                 value = str(slots[field]).lower().strip()
-                
-                if value in ['today', 'aaj', 'आज']:
-                    slots[field] = today.strftime('%Y-%m-%d')
-                elif value in ['tomorrow', 'kal', 'कल']:
-                    slots[field] = (today + timedelta(days=1)).strftime('%Y-%m-%d')
-                elif value in ['day after tomorrow', 'parso', 'परसों']:
-                    slots[field] = (today + timedelta(days=2)).strftime('%Y-%m-%d')
-                elif 'next week' in value:
-                    slots[field] = (today + timedelta(weeks=1)).strftime('%Y-%m-%d')
+
+                offset = _DATE_OFFSETS.get(value)
+                if offset is None and _NEXT_WEEK_RE.search(value):
+                    offset = 7
+
+                if offset is not None:
+                    date_str = formatted.get(offset)
+                    if date_str is None:
+                        date_str = (today + timedelta(days=offset)).strftime('%Y-%m-%d')
+                        formatted[offset] = date_str
+                    slots[field] = date_str
                 # Keep other dates as-is (assume they're already formatted or will be parsed later)
-        
+
         return slots
     
     def clear_session(self, user_id: str) -> None:
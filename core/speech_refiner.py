@@ -3,10 +3,13 @@ Speech Intent Refiner for VoxNav
 Cleans raw transcripts by resolving self-corrections and extracting actionable intent.
 """
 
+import asyncio
 import re
 import json
 import logging
 import os
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field, asdict
 
@@ -19,13 +22,128 @@ CORRECTION_KEYWORDS = {
     "hinglish": ["wait", "no", "nahi", "actually", "nhi", "ruko", "i mean", "galat"],
 }
 
-# All correction triggers
-ALL_CORRECTIONS = set()
-for keywords in CORRECTION_KEYWORDS.values():
-    ALL_CORRECTIONS.update(keywords)
+# All correction triggers - a sorted tuple for cheap, deterministic iteration
+ALL_CORRECTIONS = tuple(sorted({
+    keyword for keywords in CORRECTION_KEYWORDS.values() for keyword in keywords
+}))
 
 
-@dataclass
+def _is_word_boundary(text: str, start: int, end: int) -> bool:
+    """True when text[start:end] sits on word boundaries (like \\b)."""
+    if start > 0:
+        ch = text[start - 1]
+        if ch.isalnum() or ch == '_':
+            return False
+    if end < len(text):
+        ch = text[end]
+        if ch.isalnum() or ch == '_':
+            return False
+    return True
+
+# Patterns for the per-utterance hot path, compiled once at import so
+# calls skip the re-cache lookup entirely
+_HINDI_RE = re.compile('[\\u0900-\\u097F]')
+# No ^ anchor: used via .match(text, pos), which anchors at pos itself
+_CORRECTED_VALUE_RE = re.compile(r'[,\s]*(.+?)(?:[,.]|$)')
+_LAST_WORD_RE = re.compile(r'(\S+)\s*$')
+_WS_RE = re.compile(r'\s+')
+_FROM_TO_RE = re.compile(r'(?:from|se)\s+(\w+)\s+(?:to|tak|ko)\s+(\w+)')
+_TO_RE = re.compile(r'(?:to|tak|ko|ki)\s+(\w+)')
+_SEARCH_RE = re.compile(r'(?:search|find|look for|dhundho)\s+(?:for\s+)?(.+?)(?:\s+on|\s+pe|\s+par|$)')
+_JSON_RE = re.compile(r'\{[\s\S]*\}')
+_TOKEN_RE = re.compile(r'\w+')
+
+class _SlotMap(dict):
+    """format_map wrapper rendering missing slots as empty strings."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+# Response templates keyed by (intent, language group, is_final); the
+# nested if/elif cascade in generate_response collapses to a dict lookup
+# plus one str.format_map. Non-final BOOKING keeps its missing-slot
+# prompts as code since those depend on which slot is absent.
+_RESP_TEMPLATES = {
+    ("BOOKING", "hinglish", True): "Theek hai, {date} {time} ke liye {destination} ki ticket check kar raha hoon.",
+    ("BOOKING", "en", True): "Okay, checking tickets to {destination} for {date} {time}.",
+    ("SEARCH", "hinglish", True): "{item} search kar raha hoon.",
+    ("SEARCH", "hinglish", False): "{item} search kar raha hoon.",
+    ("SEARCH:platform", "hinglish", True): "{platform} pe {item} search kar raha hoon.",
+    ("SEARCH:platform", "hinglish", False): "{platform} pe {item} search kar raha hoon.",
+    ("SEARCH", "en", True): "Searching for {item}...",
+    ("SEARCH", "en", False): "Searching for {item}...",
+}
+
+_RESP_FALLBACK = {
+    "hinglish": "Samajh gaya, kya chahiye?",
+    "en": "Got it. How can I help?",
+}
+
+@lru_cache(maxsize=512)
+def _detect_language(text: str) -> str:
+    """Detect hindi/hinglish/english; memoized since transcripts repeat."""
+    # Hindi characters
+    if _HINDI_RE.search(text):
+        return "hindi"
+
+    # Tokenize once and probe the set: one C-level scan plus hashed
+    # lookups instead of 17 substring searches over the text
+    if len(_HINGLISH_SET.intersection(_TOKEN_RE.findall(text.lower()))) >= 2:
+        return "hinglish"
+
+    return "english"
+
+
+# Required slots per intent, built once instead of per missing_for_intent call
+_REQUIRED_SLOTS = {
+    "BOOKING": ("destination",),
+    "SEARCH": ("item",),
+    "LOGIN": (),
+    "INFO": (),
+}
+
+# Common Hindi words in Roman script, matched as whole tokens so e.g.
+# "ka" no longer fires inside "Kolkata"
+_HINGLISH_SET = frozenset([
+    "karo", "hai", "mujhe", "chahiye", "ke", "ki", "ka", "ko", "se",
+    "nahi", "haan", "theek", "acha", "bhai", "yaar", "bolo", "batao"
+])
+
+# Slot vocabularies, fused into one tagged alternation so extract_slots
+# scans the text a single time and dispatches on match.lastgroup instead
+# of running a separate substring loop per category
+_SLOT_CITIES = ("delhi", "mumbai", "bangalore", "chennai", "kolkata", "hyderabad",
+                "pune", "ahmedabad", "jaipur", "lucknow", "surat", "goa", "agra")
+_SLOT_DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+              "somvar", "mangalvar", "budhvar", "guruvar", "shukravar", "shanivar", "ravivar")
+_SLOT_RELATIVE_DATES = ("today", "tomorrow", "aaj", "kal", "parso")
+_SLOT_TIMES = ("morning", "evening", "night", "afternoon", "subah", "sham", "raat", "dopahar")
+_SLOT_PLATFORMS = ("amazon", "flipkart", "zomato", "swiggy", "irctc", "makemytrip", "uber", "ola")
+
+_CITY_SET = frozenset(_SLOT_CITIES)
+
+# Intent keywords, fused the same way: one scan tags every hit and
+# extract_intent picks by category priority (booking > search > login)
+_INTENT_VOCAB_RE = re.compile(
+    r'\b(?:'
+    r'(?P<booking>book|reserve|ticket|order|booking|buk|karo|chahiye|karwa do|book kar)'
+    r'|(?P<search>search|find|look|dhundho|batao|dikhao|weather|price|kya hai)'
+    r'|(?P<login>login|sign in|signin|log in|password)'
+    r')\b'
+)
+_SLOT_VOCAB_RE = re.compile(
+    r'\b(?:'
+    r'(?P<city>' + '|'.join(_SLOT_CITIES) + r')'
+    r'|(?P<day>' + '|'.join(_SLOT_DAYS) + r')'
+    r'|(?P<rel>' + '|'.join(_SLOT_RELATIVE_DATES) + r')'
+    r'|(?P<time>' + '|'.join(_SLOT_TIMES) + r')'
+    r'|(?P<platform>' + '|'.join(_SLOT_PLATFORMS) + r')'
+    r')\b'
+)
+
+
+@dataclass(slots=True)
 class ExtractedSlots:
     """Slots extracted from the user's speech."""
     item: Optional[str] = None
@@ -35,26 +153,18 @@ class ExtractedSlots:
     time: Optional[str] = None
     quantity: Optional[str] = None
     platform: Optional[str] = None
-    
+
     def to_dict(self) -> Dict:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        # All fields are flat strings; a comp over __slots__ skips the
+        # recursive copy asdict would do
+        return {f: v for f in self.__slots__ if (v := getattr(self, f)) is not None}
     
     def missing_for_intent(self, intent: str) -> List[str]:
         """Get missing required slots for an intent."""
-        required = {
-            "BOOKING": ["destination"],
-            "SEARCH": ["item"],
-            "LOGIN": [],
-            "INFO": [],
-        }
-        missing = []
-        for slot in required.get(intent, []):
-            if getattr(self, slot, None) is None:
-                missing.append(slot)
-        return missing
-
-
-@dataclass
+        return [slot for slot in _REQUIRED_SLOTS.get(intent, ()) if getattr(self, slot) is None]
+
+
+@dataclass(slots=True)
 class RefinedIntent:
     """Result from speech intent refinement."""
     raw_text: str
@@ -75,28 +185,62 @@ class SpeechIntentRefiner:
     3. Extracting slots (destination, date, time, etc.)
     4. Generating natural language confirmation
     """
-    
-    def __init__(self, use_llm: bool = True, api_key: Optional[str] = None):
+
+    _REFINE_CACHE_MAX = 512
+
+    # Gemini model shared across instances, keyed by (api_key, model name)
+    # so per-request refiner construction doesn't redo SDK init
+    _gemini_cache: Dict[tuple, tuple] = {}
+
+    def __init__(self, use_llm: bool = True, api_key: Optional[str] = None,
+                 use_local_llm: bool = False):
         """
         Initialize the refiner.
-        
+
         Args:
             use_llm: Whether to use LLM for complex refinement
             api_key: Gemini API key for LLM-based refinement
+            use_local_llm: Prefer a local quantized GGUF intent model
+                (via llama-cpp-python) over the Gemini cloud call
         """
         self.use_llm = use_llm
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.gemini_model = None
-        
+        self.use_local_llm = use_local_llm
+        self._local_llm = None  # None = not tried, False = unavailable
+
+        # Voice transcripts repeat often ("login", "help", common booking
+        # phrases); memoizing refine() by raw text skips the whole
+        # correction/intent/slot pipeline for repeats. Cached results are
+        # shared - callers treat RefinedIntent as read-only.
+        self._refine_cache: "OrderedDict[str, RefinedIntent]" = OrderedDict()
+        # In-flight hedged LLM call; superseded by each new utterance
+        self._pending_llm_task: Optional["asyncio.Task"] = None
+
         if self.use_llm and self.api_key:
             self._init_gemini()
     
     def _init_gemini(self):
         """Initialize Gemini for complex refinement."""
+        key = (self.api_key, 'gemini-1.5-flash')
+        cached = self._gemini_cache.get(key)
+        if cached is not None:
+            self.gemini_model, self._generation_config = cached
+            return
+
         try:
             import google.generativeai as genai
             genai.configure(api_key=self.api_key)
             self.gemini_model = genai.GenerativeModel('gemini-1.5-flash')
+            # Deterministic, tightly capped JSON output: the refinement
+            # schema is <100 tokens, and JSON mode skips the regex
+            # extraction over prose-wrapped responses
+            self._generation_config = genai.types.GenerationConfig(
+                temperature=0.0,
+                max_output_tokens=128,
+                response_mime_type="application/json",
+            )
+            self._gemini_cache[key] = (self.gemini_model, self._generation_config)
             logger.info("Gemini initialized for speech refinement")
         except Exception as e:
             logger.warning(f"Could not initialize Gemini: {e}")
@@ -104,36 +248,31 @@ class SpeechIntentRefiner:
     
     def detect_language(self, text: str) -> str:
         """Detect the language of the text."""
-        # Hindi characters
-        hindi_pattern = re.compile(r'[\u0900-\u097F]')
-        if hindi_pattern.search(text):
-            return "hindi"
-        
-        # Common Hindi words in Roman script
-        hinglish_words = ["karo", "hai", "mujhe", "chahiye", "ke", "ki", "ka", "ko", "se", 
-                         "nahi", "haan", "theek", "acha", "bhai", "yaar", "bolo", "batao"]
-        text_lower = text.lower()
-        hinglish_count = sum(1 for word in hinglish_words if word in text_lower)
-        
-        if hinglish_count >= 2:
-            return "hinglish"
-        
-        return "english"
+        return _detect_language(text)
     
     def detect_corrections(self, text: str) -> List[tuple]:
         """
         Detect correction patterns in text.
         Returns list of (correction_keyword, position, context).
         """
+        # str.find is a plain C substring search (memchr + two-way), far
+        # cheaper per literal keyword than driving the regex engine; the
+        # boundary check on the surrounding chars stands in for \b
         corrections = []
         text_lower = text.lower()
-        
+
         for keyword in ALL_CORRECTIONS:
-            pattern = rf'\b{re.escape(keyword)}\b'
-            for match in re.finditer(pattern, text_lower):
-                corrections.append((keyword, match.start(), match.end()))
-        
-        return sorted(corrections, key=lambda x: x[1])
+            klen = len(keyword)
+            i = text_lower.find(keyword)
+            while i != -1:
+                end = i + klen
+                if _is_word_boundary(text_lower, i, end):
+                    corrections.append((keyword, i, end))
+                    i = text_lower.find(keyword, end)
+                else:
+                    i = text_lower.find(keyword, i + 1)
+
+        return sorted(corrections, key=lambda c: c[1])
     
     def apply_corrections(self, text: str) -> tuple:
         """
@@ -145,40 +284,42 @@ class SpeechIntentRefiner:
             return text, []
         
         corrections_made = []
-        
-        # Use LLM for complex correction resolution
-        if self.gemini_model:
+
+        # A single correction keyword resolves deterministically - "X
+        # wait Y" always means Y - so the rule-based path below handles
+        # it and skips a ~1s LLM round-trip. Only genuinely ambiguous
+        # multi-correction utterances ("delhi wait no mumbai actually
+        # bangalore") go to the LLM.
+        if self.gemini_model and len(corrections) > 1:
             return self._llm_correct(text, corrections)
         
-        # Simple rule-based correction
-        refined = text
+        # Simple rule-based correction. Anchored pos/endpos searches keep
+        # everything as index spans on the original text - no
+        # before/after substring allocations per correction - and the
+        # refined string is assembled exactly once after the loop.
+        spans = None
         for keyword, start, end in corrections:
             # Pattern: "X... wait/no... Y" -> keep Y, discard X
-            # Find what comes after the correction keyword
-            after_correction = text[end:].strip()
-            before_correction = text[:start].strip()
-            
-            if after_correction:
-                # Get the corrected value (first meaningful phrase after keyword)
-                corrected_match = re.match(r'^[,\s]*(.+?)(?:[,.]|$)', after_correction)
-                if corrected_match:
-                    corrected_value = corrected_match.group(1).strip()
-                    
-                    # Find what's being corrected (usually the last word/phrase before keyword)
-                    original_match = re.search(r'(\S+)\s*$', before_correction)
-                    if original_match:
-                        original_value = original_match.group(1)
-                        
-                        # Build refined text
-                        prefix = before_correction[:original_match.start()].strip()
-                        suffix = after_correction[corrected_match.end():].strip() if corrected_match.end() < len(after_correction) else ""
-                        
-                        refined = f"{prefix} {corrected_value} {suffix}".strip()
-                        corrections_made.append(f"'{original_value}' → '{corrected_value}'")
-        
+            # Get the corrected value (first meaningful phrase after keyword)
+            corrected_match = _CORRECTED_VALUE_RE.match(text, end)
+            if corrected_match:
+                corrected_value = corrected_match.group(1).strip()
+
+                # Find what's being corrected (usually the last word/phrase before keyword)
+                original_match = _LAST_WORD_RE.search(text, 0, start)
+                if original_match:
+                    spans = (
+                        (0, original_match.start(1)),            # prefix
+                        corrected_match.span(1),                 # corrected value
+                        (corrected_match.end(), len(text)),      # suffix
+                    )
+                    corrections_made.append(f"'{original_match.group(1)}' → '{corrected_value}'")
+
+        refined = ' '.join(text[a:b] for a, b in spans) if spans else text
+
         # Clean up multiple spaces
-        refined = re.sub(r'\s+', ' ', refined).strip()
-        
+        refined = _WS_RE.sub(' ', refined).strip()
+
         return refined, corrections_made
     
     def _llm_correct(self, text: str, corrections: List[tuple]) -> tuple:
@@ -209,130 +350,99 @@ Return ONLY the refined text, nothing else."""
     
     def extract_intent(self, text: str) -> str:
         """Extract intent category from text."""
-        text_lower = text.lower()
-        
-        # Booking keywords
-        booking_words = ["book", "reserve", "ticket", "order", "booking", 
-                        "buk", "karo", "chahiye", "karwa do", "book kar"]
-        if any(word in text_lower for word in booking_words):
-            return "BOOKING"
-        
-        # Search keywords
-        search_words = ["search", "find", "look", "dhundho", "batao", 
-                       "dikhao", "weather", "price", "kya hai"]
-        if any(word in text_lower for word in search_words):
+        hits = set()
+        for match in _INTENT_VOCAB_RE.finditer(text.lower()):
+            if match.lastgroup == "booking":
+                return "BOOKING"  # highest priority, no need to keep scanning
+            hits.add(match.lastgroup)
+
+        if "search" in hits:
             return "SEARCH"
-        
-        # Login keywords
-        login_words = ["login", "sign in", "signin", "log in", "password"]
-        if any(word in text_lower for word in login_words):
+        if "login" in hits:
             return "LOGIN"
-        
         return "INFO"
     
     def extract_slots(self, text: str, intent: str) -> ExtractedSlots:
         """Extract relevant slots from refined text."""
         slots = ExtractedSlots()
         text_lower = text.lower()
-        
-        # Cities (common Indian cities)
-        cities = ["delhi", "mumbai", "bangalore", "chennai", "kolkata", "hyderabad",
-                 "pune", "ahmedabad", "jaipur", "lucknow", "surat", "goa", "agra"]
-        
-        found_cities = [city for city in cities if city in text_lower]
-        
+
+        # One pass over the text tags every vocabulary hit; first hit per
+        # category wins (day names take precedence over relative dates,
+        # matching the old list order)
+        found_cities = []
+        hits = {}
+        for match in _SLOT_VOCAB_RE.finditer(text_lower):
+            group = match.lastgroup
+            if group == 'city':
+                found_cities.append(match.group())
+            else:
+                hits.setdefault(group, match.group())
+
+        if (date := hits.get('day') or hits.get('rel')) is not None:
+            slots.date = date.title()
+        if 'time' in hits:
+            slots.time = hits['time'].title()
+        if 'platform' in hits:
+            slots.platform = hits['platform'].title()
+
         # Source/Destination detection
-        # Pattern: "from X to Y" or "X se Y"
-        from_to = re.search(r'(?:from|se)\s+(\w+)\s+(?:to|tak|ko)\s+(\w+)', text_lower)
+        # Pattern: "from X to Y" or "X se Y" - the two-city regex only
+        # runs when a direction marker is actually present
+        from_to = None
+        if "from" in text_lower or "se" in text_lower:
+            from_to = _FROM_TO_RE.search(text_lower)
         if from_to:
             slots.source = from_to.group(1).title()
             slots.destination = from_to.group(2).title()
         elif "to " in text_lower or " tak " in text_lower or " ko " in text_lower:
             # Pattern: "to Y" or "Y tak"
-            to_match = re.search(r'(?:to|tak|ko|ki)\s+(\w+)', text_lower)
-            if to_match and to_match.group(1).lower() in cities:
+            to_match = _TO_RE.search(text_lower)
+            if to_match and to_match.group(1) in _CITY_SET:
                 slots.destination = to_match.group(1).title()
         elif found_cities:
-            slots.destination = found_cities[0].title()
-        
-        # Date detection
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
-               "somvar", "mangalvar", "budhvar", "guruvar", "shukravar", "shanivar", "ravivar"]
-        relative_dates = ["today", "tomorrow", "aaj", "kal", "parso"]
-        
-        for day in days + relative_dates:
-            if day in text_lower:
-                slots.date = day.title()
-                break
-        
-        # Time detection
-        times = ["morning", "evening", "night", "afternoon", "subah", "sham", "raat", "dopahar"]
-        for time in times:
-            if time in text_lower:
-                slots.time = time.title()
-                break
-        
-        # Platform detection
-        platforms = ["amazon", "flipkart", "zomato", "swiggy", "irctc", "makemytrip", "uber", "ola"]
-        for platform in platforms:
-            if platform in text_lower:
-                slots.platform = platform.title()
-                break
-        
+            # Prefer the last-mentioned city so self-corrections
+            # ("...Goa, no wait, Jaipur") land on the correction
+            slots.destination = found_cities[-1].title()
+
         # Item/Product detection (for search)
         if intent == "SEARCH":
             # Try to extract what they're searching for
-            search_match = re.search(r'(?:search|find|look for|dhundho)\s+(?:for\s+)?(.+?)(?:\s+on|\s+pe|\s+par|$)', text_lower)
+            search_match = _SEARCH_RE.search(text_lower)
             if search_match:
                 slots.item = search_match.group(1).strip().title()
         
         return slots
     
-    def generate_response(self, intent: str, slots: ExtractedSlots, language: str, is_final: bool) -> str:
+    def generate_response(self, intent: str, slots: ExtractedSlots, language: str, is_final: bool,
+                          missing: Optional[List[str]] = None) -> str:
         """Generate natural language confirmation response."""
         slot_dict = slots.to_dict()
-        
-        if language in ["hindi", "hinglish"]:
-            if intent == "BOOKING":
-                if is_final:
-                    dest = slot_dict.get("destination", "")
-                    date = slot_dict.get("date", "")
-                    time = slot_dict.get("time", "")
-                    return f"Theek hai, {date} {time} ke liye {dest} ki ticket check kar raha hoon."
-                else:
-                    missing = slots.missing_for_intent(intent)
-                    if "date" in missing:
-                        return "Kab ke liye book karni hai? Date batao."
-                    if "destination" in missing:
-                        return "Kahan jaana hai? Destination batao."
-                    return "Aur koi details chahiye?"
-            
-            elif intent == "SEARCH":
-                item = slot_dict.get("item", "")
-                platform = slot_dict.get("platform", "")
-                if platform:
-                    return f"{platform} pe {item} search kar raha hoon."
-                return f"{item} search kar raha hoon."
-            
-            return "Samajh gaya, kya chahiye?"
-        
-        else:  # English
-            if intent == "BOOKING":
-                if is_final:
-                    dest = slot_dict.get("destination", "")
-                    date = slot_dict.get("date", "")
-                    time = slot_dict.get("time", "")
-                    return f"Okay, checking tickets to {dest} for {date} {time}."
-                else:
-                    missing = slots.missing_for_intent(intent)
-                    if missing:
-                        return f"I need more details: {', '.join(missing)}."
-            
-            elif intent == "SEARCH":
-                item = slot_dict.get("item", "")
-                return f"Searching for {item}..."
-            
-            return "Got it. How can I help?"
+        if missing is None:
+            missing = slots.missing_for_intent(intent)
+
+        lang_key = "hinglish" if language in ("hindi", "hinglish") else "en"
+
+        template_intent = intent
+        if intent == "SEARCH" and lang_key == "hinglish" and slot_dict.get("platform"):
+            template_intent = "SEARCH:platform"
+
+        template = _RESP_TEMPLATES.get((template_intent, lang_key, is_final))
+        if template is not None:
+            return template.format_map(_SlotMap(slot_dict))
+
+        # Non-final BOOKING: prompt for whichever slot is absent
+        if intent == "BOOKING":
+            if lang_key == "hinglish":
+                if "date" in missing:
+                    return "Kab ke liye book karni hai? Date batao."
+                if "destination" in missing:
+                    return "Kahan jaana hai? Destination batao."
+                return "Aur koi details chahiye?"
+            if missing:
+                return f"I need more details: {', '.join(missing)}."
+
+        return _RESP_FALLBACK[lang_key]
     
     def refine(self, raw_text: str) -> RefinedIntent:
         """
@@ -344,6 +454,11 @@ Return ONLY the refined text, nothing else."""
         Returns:
             RefinedIntent with all processed data
         """
+        cached = self._refine_cache.get(raw_text)
+        if cached is not None:
+            self._refine_cache.move_to_end(raw_text)
+            return cached
+
         # Detect language
         language = self.detect_language(raw_text)
         
@@ -360,10 +475,10 @@ Return ONLY the refined text, nothing else."""
         missing = slots.missing_for_intent(intent)
         is_final = len(missing) == 0
         
-        # Generate response
-        response = self.generate_response(intent, slots, language, is_final)
+        # Generate response (reusing the missing list computed above)
+        response = self.generate_response(intent, slots, language, is_final, missing=missing)
         
-        return RefinedIntent(
+        result = RefinedIntent(
             raw_text=raw_text,
             refined_text=refined_text,
             intent_category=intent,
@@ -373,13 +488,16 @@ Return ONLY the refined text, nothing else."""
             language_detected=language,
             corrections_made=corrections
         )
-    
-    def refine_with_llm(self, raw_text: str) -> RefinedIntent:
-        """Use full LLM for refinement (more accurate but slower)."""
-        if not self.gemini_model:
-            return self.refine(raw_text)
-        
-        prompt = f"""You are a Speech Intent Refiner for a voice assistant.
+
+        self._refine_cache[raw_text] = result
+        if len(self._refine_cache) > self._REFINE_CACHE_MAX:
+            self._refine_cache.popitem(last=False)
+
+        return result
+
+    def _refinement_prompt(self, raw_text: str) -> str:
+        """Build the full-refinement prompt."""
+        return f"""You are a Speech Intent Refiner for a voice assistant.
 
 Raw transcript: "{raw_text}"
 
@@ -398,31 +516,165 @@ Return JSON:
   "response_speech": "Natural confirmation in user's language"
 }}"""
 
+    def _refined_from_response(self, raw_text: str, result_text: str) -> Optional[RefinedIntent]:
+        """Parse a Gemini refinement response into a RefinedIntent."""
+        # JSON mode returns the bare object; the regex fallback covers
+        # older prose-wrapped responses
         try:
-            response = self.gemini_model.generate_content(prompt)
-            result_text = response.text.strip()
-            
-            # Extract JSON from response
-            json_match = re.search(r'\{[\s\S]*\}', result_text)
-            if json_match:
-                result = json.loads(json_match.group())
-                
-                return RefinedIntent(
-                    raw_text=raw_text,
-                    refined_text=result.get("refined_text", raw_text),
-                    intent_category=result.get("intent_category", "INFO"),
-                    extracted_slots=result.get("extracted_slots", {}),
-                    is_final=result.get("is_final", False),
-                    response_speech=result.get("response_speech", ""),
-                    language_detected=self.detect_language(raw_text),
-                    corrections_made=["LLM refinement"]
+            result = json.loads(result_text)
+        except ValueError:
+            json_match = _JSON_RE.search(result_text)
+            if not json_match:
+                return None
+            result = json.loads(json_match.group())
+
+        return RefinedIntent(
+            raw_text=raw_text,
+            refined_text=result.get("refined_text", raw_text),
+            intent_category=result.get("intent_category", "INFO"),
+            extracted_slots=result.get("extracted_slots", {}),
+            is_final=result.get("is_final", False),
+            response_speech=result.get("response_speech", ""),
+            language_detected=self.detect_language(raw_text),
+            corrections_made=["LLM refinement"]
+        )
+
+    def _get_local_llm(self):
+        """Lazily load the local quantized intent model, if enabled."""
+        if not self.use_local_llm:
+            return None
+        if self._local_llm is None:
+            try:
+                from llama_cpp import Llama
+                model_path = os.getenv(
+                    "VOXNAV_LOCAL_LLM_PATH",
+                    "llama-3.2-3b-hindi-intent-Q4_K_M.gguf"
                 )
+                self._local_llm = Llama(
+                    model_path=model_path,
+                    n_ctx=512,
+                    n_threads=os.cpu_count(),
+                    verbose=False
+                )
+                logger.info(f"Local intent model loaded from {model_path}")
+            except Exception as e:
+                logger.warning(f"Local intent model unavailable: {e}")
+                self._local_llm = False
+        return self._local_llm or None
+
+    def _refine_with_local_llm(self, raw_text: str) -> Optional[RefinedIntent]:
+        """
+        Refine with the local INT4 model, if one is loaded.
+
+        A 3B Hindi-intent model quantized to Q4 answers in a few hundred
+        ms on CPU - no network round-trip - which is why it's consulted
+        before Gemini. Returns None when unavailable or unparseable so
+        the caller falls through to the cloud path.
+        """
+        local = self._get_local_llm()
+        if local is None:
+            return None
+        try:
+            out = local(self._refinement_prompt(raw_text), max_tokens=64, temperature=0.0)
+            text = out["choices"][0]["text"].strip()
+            return self._refined_from_response(raw_text, text)
+        except Exception as e:
+            logger.error(f"Local refinement failed: {e}")
+            return None
+
+    def refine_with_llm(self, raw_text: str) -> RefinedIntent:
+        """Use full LLM for refinement (more accurate but slower)."""
+        refined = self._refine_with_local_llm(raw_text)
+        if refined is not None:
+            return refined
+
+        if not self.gemini_model:
+            return self.refine(raw_text)
+
+        try:
+            response = self.gemini_model.generate_content(
+                self._refinement_prompt(raw_text),
+                generation_config=self._generation_config
+            )
+            refined = self._refined_from_response(raw_text, response.text.strip())
+            if refined is not None:
+                return refined
         except Exception as e:
             logger.error(f"LLM refinement failed: {e}")
-        
+
         # Fallback to rule-based
         return self.refine(raw_text)
 
+    async def refine_hedged(
+        self,
+        raw_text: str,
+        budget: float = 0.8,
+        on_late_result=None
+    ) -> RefinedIntent:
+        """
+        Hedged refinement: answer within budget, upgrade if Gemini is fast.
+
+        Starts the Gemini refinement and computes the rule-based result
+        concurrently. If the LLM answers within `budget` seconds its
+        result wins; otherwise the rule-based result is returned
+        immediately - a voice assistant can't sit silent through a
+        multi-second cloud call. A late LLM result is either delivered
+        through on_late_result or the call is cancelled. Each new
+        utterance cancels the previous in-flight call (push-to-talk users
+        routinely restate before the last refinement lands).
+        """
+        if not self.gemini_model:
+            return self.refine(raw_text)
+
+        if self._pending_llm_task is not None and not self._pending_llm_task.done():
+            self._pending_llm_task.cancel()
+
+        llm_task = asyncio.ensure_future(self.refine_with_llm_async(raw_text))
+        self._pending_llm_task = llm_task
+        rule_based = self.refine(raw_text)
+
+        done, _ = await asyncio.wait({llm_task}, timeout=budget)
+        if llm_task in done and not llm_task.cancelled() and llm_task.exception() is None:
+            return llm_task.result()
+
+        if on_late_result is not None:
+            def _deliver(task):
+                if not task.cancelled() and task.exception() is None:
+                    on_late_result(task.result())
+            llm_task.add_done_callback(_deliver)
+        else:
+            llm_task.cancel()
+
+        return rule_based
+
+    async def refine_with_llm_async(self, raw_text: str) -> RefinedIntent:
+        """
+        Async variant of refine_with_llm.
+
+        Uses generate_content_async so concurrent refinements overlap on
+        one thread instead of serializing multi-second Gemini calls.
+        """
+        if self.use_local_llm:
+            refined = await asyncio.to_thread(self._refine_with_local_llm, raw_text)
+            if refined is not None:
+                return refined
+
+        if not self.gemini_model:
+            return self.refine(raw_text)
+
+        try:
+            response = await self.gemini_model.generate_content_async(
+                self._refinement_prompt(raw_text),
+                generation_config=self._generation_config
+            )
+            refined = self._refined_from_response(raw_text, response.text.strip())
+            if refined is not None:
+                return refined
+        except Exception as e:
+            logger.error(f"LLM refinement failed: {e}")
+
+        return self.refine(raw_text)
+
 
 # Convenience function
 def refine_speech(raw_text: str, use_llm: bool = False) -> Dict[str, Any]:
@@ -3,33 +3,29 @@ Voice Input Module for VoxNav
 Records audio from microphone and converts to text using speech recognition.
 """
 
+from __future__ import annotations
+
 import os
 import wave
 import tempfile
 import logging
+from importlib.util import find_spec
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-# Try to import optional dependencies
-PYAUDIO_AVAILABLE = False
-SPEECH_RECOGNITION_AVAILABLE = False
-
-try:
-    import pyaudio
-    PYAUDIO_AVAILABLE = True
-except ImportError:
-    logger.warning("pyaudio not installed. Run: pip install pyaudio")
+# Availability is checked without importing: find_spec only scans the
+# path, deferring the heavy pyaudio/speech_recognition imports
+# (~100-300ms) to the first VoiceInput construction so callers that only
+# want the refiner don't pay for them
+PYAUDIO_AVAILABLE = find_spec("pyaudio") is not None
+SPEECH_RECOGNITION_AVAILABLE = find_spec("speech_recognition") is not None
 
-try:
-    import speech_recognition as sr
-    SPEECH_RECOGNITION_AVAILABLE = True
-except ImportError:
-    logger.warning("speech_recognition not installed. Run: pip install SpeechRecognition")
+sr = None  # speech_recognition module, bound lazily in _check_dependencies
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceInputResult:
     """Result from voice input."""
     text: str
@@ -71,7 +67,13 @@ class VoiceInput:
         
         self.recognizer = None
         self.microphone = None
-        
+        # Preallocated capture buffer, reused across utterances so each
+        # listen() writes frames in place instead of accumulating a chunk
+        # list and joining it (two full copies of the audio)
+        self._capture_buf = bytearray()
+        # faster-whisper model: None = not tried, False = unavailable
+        self._whisper_model = None
+
         self._check_dependencies()
     
     def _check_dependencies(self):
@@ -90,7 +92,12 @@ class VoiceInput:
                 "SpeechRecognition is required. Install with:\n"
                 "  pip install SpeechRecognition"
             )
-        
+
+        global sr
+        if sr is None:
+            import speech_recognition
+            sr = speech_recognition
+
         self.recognizer = sr.Recognizer()
     
     def _get_microphone(self) -> sr.Microphone:
@@ -144,11 +151,17 @@ class VoiceInput:
                     self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
                 
                 print("🎧 Listening... (speak now)")
-                audio = self.recognizer.listen(
-                    source,
-                    timeout=timeout,
-                    phrase_time_limit=phrase_time_limit
-                )
+                try:
+                    audio = self._listen_into_buffer(source, timeout, phrase_time_limit)
+                except sr.WaitTimeoutError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Buffered capture failed ({e}), using recognizer.listen")
+                    audio = self.recognizer.listen(
+                        source,
+                        timeout=timeout,
+                        phrase_time_limit=phrase_time_limit
+                    )
             
             print("🔄 Processing speech...")
             
@@ -183,6 +196,63 @@ class VoiceInput:
                 error=str(e)
             )
     
+    def _listen_into_buffer(self, source, timeout: float, phrase_time_limit: float) -> "sr.AudioData":
+        """
+        Record speech from source directly into the preallocated buffer.
+
+        recognizer.listen accumulates chunks in a list and joins them,
+        copying the whole utterance twice (~320KB for 10s at 16kHz). This
+        writes each chunk straight into a reused bytearray via memoryview
+        slices, so the only copy is the final AudioData construction.
+        """
+        import audioop
+
+        width = source.SAMPLE_WIDTH
+        rate = source.SAMPLE_RATE
+        chunk_bytes = source.CHUNK * width
+        seconds_per_chunk = source.CHUNK / rate
+
+        capacity = int(phrase_time_limit * rate * width) + chunk_bytes
+        if len(self._capture_buf) < capacity:
+            self._capture_buf = bytearray(capacity)
+        view = memoryview(self._capture_buf)
+
+        # Wait for speech to start, keeping the last silent chunk so the
+        # utterance onset isn't clipped
+        threshold = self.recognizer.energy_threshold
+        waited = 0.0
+        previous = b""
+        while True:
+            data = source.stream.read(source.CHUNK)
+            if audioop.rms(data, width) > threshold:
+                break
+            previous = data
+            waited += seconds_per_chunk
+            if waited > timeout:
+                raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+
+        pos = 0
+        if previous:
+            view[:len(previous)] = previous
+            pos = len(previous)
+        view[pos:pos + len(data)] = data
+        pos += len(data)
+
+        # Record until a pause, the phrase limit, or a full buffer
+        silence = 0.0
+        while pos + chunk_bytes <= capacity:
+            data = source.stream.read(source.CHUNK)
+            view[pos:pos + len(data)] = data
+            pos += len(data)
+            if audioop.rms(data, width) > threshold:
+                silence = 0.0
+            else:
+                silence += seconds_per_chunk
+                if silence >= self.recognizer.pause_threshold:
+                    break
+
+        return sr.AudioData(bytes(view[:pos]), rate, width)
+
     def _transcribe(self, audio: sr.AudioData) -> Tuple[str, float]:
         """
         Transcribe audio using configured engine.
@@ -212,14 +282,39 @@ class VoiceInput:
         except sr.RequestError as e:
             raise Exception(f"Google Speech API error: {e}")
     
+    def _get_whisper_model(self):
+        """Lazily load the int8 faster-whisper model, if available."""
+        if self._whisper_model is None:
+            try:
+                from faster_whisper import WhisperModel
+                self._whisper_model = WhisperModel("base", device="cpu", compute_type="int8")
+                logger.info("faster-whisper (int8) loaded for transcription")
+            except ImportError:
+                logger.warning("faster-whisper not installed, using openai-whisper")
+                self._whisper_model = False
+        return self._whisper_model or None
+
     def _transcribe_whisper(self, audio: sr.AudioData) -> Tuple[str, float]:
         """Use local Whisper model (offline)."""
         try:
+            model = self._get_whisper_model()
+            if model is not None:
+                # CTranslate2 int8 inference is 4-5x faster than the
+                # reference FP32 model on CPU
+                import numpy as np
+                raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+                samples = np.frombuffer(raw, np.int16).astype(np.float32) / 32768.0
+                segments, _ = model.transcribe(
+                    samples,
+                    language=self.language.split("-")[0]  # "hi" from "hi-IN"
+                )
+                return " ".join(s.text.strip() for s in segments), 0.85
+
             # Requires openai-whisper package
             text = self.recognizer.recognize_whisper(
                 audio,
                 model="base",
-                language=self.language.split("-")[0]  # "hi" from "hi-IN"
+                language=self.language.split("-")[0]
             )
             return text, 0.85
         except Exception as e:
@@ -3,9 +3,9 @@
 Debug Ollama intent classification - see raw responses.
 """
 
+import asyncio
 import requests
 import json
-import re
 
 print("🔍 Debugging Ollama Intent Classification")
 print("=" * 60)
@@ -38,38 +38,54 @@ test_cases = [
     "Help me",
 ]
 
-for query in test_cases:
-    prompt = INTENT_PROMPT.format(input=query)
-    
-    payload = {
+
+def build_payload(query):
+    # format=json makes Ollama emit a bare JSON object, so no regex
+    # extraction is needed; the schema is <20 tokens, hence num_predict=32
+    return {
         "model": model,
-        "prompt": prompt,
+        "prompt": INTENT_PROMPT.format(input=query),
         "stream": False,
-        "options": {"temperature": 0.1, "num_predict": 100}
+        "format": "json",
+        "options": {"temperature": 0.1, "num_predict": 32}
     }
-    
-    resp = requests.post("http://localhost:11434/api/generate", json=payload, timeout=60)
-    raw_response = resp.json().get("response", "")
-    
+
+
+async def classify(client, query):
+    resp = await client.post("http://localhost:11434/api/generate",
+                             json=build_payload(query), timeout=60)
+    return resp.json().get("response", "")
+
+
+async def classify_all():
+    # One connection, all queries in flight at once - the queries are
+    # independent, so wall time is the slowest call instead of the sum
+    import httpx
+    async with httpx.AsyncClient() as client:
+        return await asyncio.gather(*(classify(client, q) for q in test_cases))
+
+
+try:
+    responses = asyncio.run(classify_all())
+except ImportError:
+    # No httpx: at least reuse one TCP connection instead of
+    # reconnecting to localhost:11434 per query
+    session = requests.Session()
+    responses = [
+        session.post("http://localhost:11434/api/generate",
+                     json=build_payload(q), timeout=60).json().get("response", "")
+        for q in test_cases
+    ]
+
+for query, raw_response in zip(test_cases, responses):
     print(f"📝 Query: '{query}'")
     print(f"📤 Raw Response: '{raw_response[:200]}'")
-    
-    # Try to extract intent
+
+    # format=json guarantees a parseable object - no regex extraction
     try:
-        # Method 1: Find JSON
-        json_match = re.search(r'\{[^{}]*\}', raw_response, re.DOTALL)
-        if json_match:
-            result = json.loads(json_match.group())
-            print(f"✅ Parsed: {result}")
-        else:
-            # Method 2: Look for intent keyword
-            for intent in ["BOOKING", "SEARCH", "CANCEL", "HELP", "GENERAL_INFO"]:
-                if intent in raw_response.upper():
-                    print(f"⚠️ Found keyword: {intent}")
-                    break
-            else:
-                print("❌ Could not parse")
+        result = json.loads(raw_response)
+        print(f"✅ Parsed: {result}")
     except Exception as e:
         print(f"❌ Parse error: {e}")
-    
+
     print()
@@ -16,18 +16,34 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def get_orchestrator():
+    """Build (once) the shared orchestrator used by the examples.
+
+    lazy_load=True defers the multi-second whisper model load until an
+    audio path is actually processed, so the text-only examples never
+    pull torch or the ASR weights into memory.
+    """
+    global _orchestrator
+    if _orchestrator is None:
+        from core import VoxNavOrchestrator
+
+        _orchestrator = VoxNavOrchestrator(
+            asr_model_path="hindi_models/whisper-medium-hi_alldata_multigpu",
+            asr_device="cuda",  # or "cpu"
+            openrouter_api_key=os.getenv("OPENROUTER_API_KEY"),
+            lazy_load=True
+        )
+    return _orchestrator
+
+
+_orchestrator = None
+
+
 def example_text_processing():
     """Example: Process text input (simulating transcribed speech)."""
-    
-    from core import VoxNavOrchestrator
-    
-    # Initialize VoxNav (lazy loads models)
-    voxnav = VoxNavOrchestrator(
-        asr_model_path="hindi_models/whisper-medium-hi_alldata_multigpu",
-        asr_device="cuda",  # or "cpu"
-        openrouter_api_key=os.getenv("OPENROUTER_API_KEY")
-    )
-    
+
+    voxnav = get_orchestrator()
+
     # Example user inputs
     test_inputs = [
         # Hinglish booking request
@@ -82,52 +98,44 @@ def example_text_processing():
 
 
 def example_audio_processing():
-    """Example: Process audio file."""
-    
-    from core import VoxNavOrchestrator
-    
-    # Initialize VoxNav
-    voxnav = VoxNavOrchestrator(
-        asr_model_path="hindi_models/whisper-medium-hi_alldata_multigpu",
-        asr_device="cuda",
-        openrouter_api_key=os.getenv("OPENROUTER_API_KEY")
-    )
-    
-    # Example audio file
-    audio_file = "test_audio.mp3"
-    
-    if not os.path.exists(audio_file):
-        print(f"⚠️ Audio file '{audio_file}' not found. Creating sample...")
-        print("Please provide an audio file to test.")
+    """Example: Process audio files as one transcription batch."""
+
+    from config import config
+
+    voxnav = get_orchestrator()
+
+    # Example audio files - all clips are transcribed in a single padded
+    # ASR batch instead of one model invocation per file
+    audio_files = [f for f in ["test_audio.mp3"] if os.path.exists(f)]
+
+    if not audio_files:
+        print("⚠️ No audio files found. Please provide audio files to test.")
         return
-    
+
     user_id = "test_user_456"
-    
-    print(f"\n🎤 Processing audio: {audio_file}")
-    
-    response = voxnav.process_audio(
-        audio_input=audio_file,
+
+    print(f"\n🎤 Processing {len(audio_files)} audio file(s)")
+
+    responses = voxnav.process_audio_batch(
+        audio_files,
         user_id=user_id,
         current_url="https://www.makemytrip.com",
-        language="hi"
+        language="hi",
+        batch_size=config.asr.batch_size
     )
-    
-    print(f"\n📝 Transcription: {response.transcription}")
-    print(f"🎯 Intent: {response.intent}")
-    print(f"💬 Response: {response.message}")
+
+    for audio_file, response in zip(audio_files, responses):
+        print(f"\n🎵 File: {audio_file}")
+        print(f"📝 Transcription: {response.transcription}")
+        print(f"🎯 Intent: {response.intent}")
+        print(f"💬 Response: {response.message}")
 
 
 def example_slot_filling_conversation():
     """Example: Multi-turn conversation with slot filling."""
-    
-    from core import VoxNavOrchestrator
-    
-    voxnav = VoxNavOrchestrator(
-        asr_model_path="hindi_models/whisper-medium-hi_alldata_multigpu",
-        asr_device="cuda",
-        openrouter_api_key=os.getenv("OPENROUTER_API_KEY")
-    )
-    
+
+    voxnav = get_orchestrator()
+
     user_id = "conversation_user"
     
     # Multi-turn conversation
@@ -182,8 +190,9 @@ def example_intent_classification():
     print("🎯 INTENT CLASSIFICATION EXAMPLES")
     print("="*60)
     
-    for phrase in test_phrases:
-        result = dispatcher.classify(phrase)
+    # One batched call classifies all phrases in a single round-trip
+    results = dispatcher.classify_batch(test_phrases)
+    for phrase, result in zip(test_phrases, results):
         print(f"\n📝 \"{phrase}\"")
         print(f"   → Intent: {result.intent.value} | Sub: {result.sub_intent} | Confidence: {result.confidence:.2f}")
         print(f"   → Language: {result.language_detected} | Entities: {result.entities}")
@@ -192,9 +201,9 @@ def example_intent_classification():
 def example_language_detection():
     """Example: Language detection."""
     
-    from core import MultilingualHandler
-    
-    handler = MultilingualHandler()
+    from core.multilingual import get_handler
+
+    handler = get_handler()
     
     test_texts = [
         "Book a train ticket",
@@ -209,8 +218,7 @@ def example_language_detection():
     print("🌐 LANGUAGE DETECTION EXAMPLES")
     print("="*60)
     
-    for text in test_texts:
-        result = handler.detect_language(text)
+    for text, result in zip(test_texts, handler.detect_language_batch(test_texts)):
         print(f"\n📝 \"{text}\"")
         print(f"   → Language: {result.primary_language.value} | Script: {result.script} | Confidence: {result.confidence:.2f}")
 
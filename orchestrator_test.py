@@ -3,6 +3,7 @@
 Test VoxNav orchestrator with mock API key to see initialization
 """
 
+import asyncio
 import os
 from core import VoxNavOrchestrator
 
@@ -31,24 +32,42 @@ try:
         "Mujhe help chahiye",
         "Book a train"
     ]
-    
-    user_id = "test_user"
-    
-    for i, user_input in enumerate(test_inputs, 1):
-        print(f"\n--- Test {i}: '{user_input}' ---")
-        try:
-            # This will fail on API calls but let's see how far we get
-            response = voxnav.process_text(
-                text_input=user_input,
-                user_id=user_id
+
+    # The inputs are independent, so overlap their (blocking) API calls:
+    # each process_text runs in a worker thread and the semaphore caps
+    # in-flight requests at 4. Distinct user ids keep the orchestrator's
+    # per-user turn lock from serializing the batch.
+    sem = asyncio.Semaphore(4)
+
+    async def run_one(i, user_input):
+        async with sem:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                lambda: voxnav.process_text(
+                    text_input=user_input,
+                    user_id=f"test_user_{i}"
+                )
             )
-            print(f"✅ Processed: {response.message}")
-        except Exception as e:
-            error_msg = str(e)
+
+    async def run_all():
+        return await asyncio.gather(
+            *(run_one(i, x) for i, x in enumerate(test_inputs, 1)),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(run_all())
+
+    for i, (user_input, result) in enumerate(zip(test_inputs, results), 1):
+        print(f"\n--- Test {i}: '{user_input}' ---")
+        if isinstance(result, Exception):
+            error_msg = str(result)
             if "API key" in error_msg or "OpenRouter" in error_msg:
                 print(f"⚠️  API required: {error_msg.split('.')[0]}")
             else:
                 print(f"❌ Error: {error_msg}")
+        else:
+            print(f"✅ Processed: {result.message}")
                 
 except Exception as e:
     print(f"❌ Initialization failed: {e}")
@@ -12,7 +12,7 @@ print("=" * 50)
 # Test 1: Basic imports
 print("\n1. Testing imports...")
 try:
-    from core.multilingual import MultilingualHandler
+    from core.multilingual import MultilingualHandler, get_handler
     from core.intent_dispatcher import IntentDispatcher
     from core.slot_filler import SlotFiller
     print("✅ All core modules imported successfully")
@@ -23,7 +23,7 @@ except Exception as e:
 # Test 2: Language detection (no API required)
 print("\n2. Testing language detection...")
 try:
-    handler = MultilingualHandler()
+    handler = get_handler()
     test_cases = [
         ("Book a train", "Should be hinglish"),
         ("नमस्ते", "Should be Hindi"),
@@ -32,8 +32,8 @@ try:
         ("How are you", "Should be English")
     ]
     
-    for text, expected in test_cases:
-        result = handler.detect_language(text)
+    results = handler.detect_language_batch([text for text, _ in test_cases])
+    for (text, expected), result in zip(test_cases, results):
         print(f"   '{text}' -> {result.primary_language.value} ({result.script})")
     
     print("✅ Language detection working correctly")
@@ -2,6 +2,7 @@
 """
 VoxNav Simple Test - with rate limit handling
 """
+import json
 import os
 import time
 
@@ -23,33 +24,52 @@ MODEL_NAME = 'models/gemini-2.5-flash'
 print(f"🧪 Testing model: {MODEL_NAME}")
 print("-" * 50)
 
+def gen(prompt, tokens=32, mime_type=None):
+    """Bounded generate_content: capped output, 20s timeout, 3 tries with
+    backoff on 429 so a degraded API can't hang the script or burn tokens."""
+    config = {"max_output_tokens": tokens}
+    if mime_type:
+        config["response_mime_type"] = mime_type
+    for attempt in range(3):
+        try:
+            return model.generate_content(
+                prompt,
+                generation_config=config,
+                request_options={"timeout": 20}
+            )
+        except Exception as e:
+            if "429" in str(e) and attempt < 2:
+                time.sleep(2 ** attempt * 1.5)
+                continue
+            raise
+
+
 try:
     model = genai.GenerativeModel(MODEL_NAME)
-    
+
     # Simple test
-    response = model.generate_content("Say 'Hello VoxNav!' in one line")
+    response = gen("Say 'Hello VoxNav!' in one line")
     print(f"✅ Model Response: {response.text.strip()}")
     
     print("\n🎯 Testing Intent Classification...")
     print("-" * 50)
-    
-    # Test intent classification with a simple prompt
-    intent_prompt = """Classify this user input into one category: BOOKING, SEARCH, HELP, CANCEL
-
-User: "Mujhe Delhi se Mumbai ki train book karni hai"
 
-Reply with just the category name."""
+    # One row-marshaled call classifies every phrase - no per-phrase
+    # round-trips, no rate-limit sleeps between them
+    test_phrases = [
+        "Mujhe Delhi se Mumbai ki train book karni hai",
+        "Amazon pe iPhone search karo",
+    ]
+    intent_prompt = (
+        "Classify each line into one category: BOOKING, SEARCH, HELP, CANCEL.\n"
+        "Return a JSON array of category names, same order, nothing else.\n"
+        + "\n".join(f"{i + 1}. {phrase}" for i, phrase in enumerate(test_phrases))
+    )
 
-    response = model.generate_content(intent_prompt)
-    print(f"Input: 'Mujhe Delhi se Mumbai ki train book karni hai'")
-    print(f"Intent: {response.text.strip()}")
-    
-    time.sleep(2)  # Small delay to avoid rate limits
-    
-    # Another test
-    response = model.generate_content("""Classify: "Amazon pe iPhone search karo" -> BOOKING or SEARCH?""")
-    print(f"\nInput: 'Amazon pe iPhone search karo'")
-    print(f"Intent: {response.text.strip()}")
+    response = gen(intent_prompt, tokens=64, mime_type="application/json")
+    for phrase, intent in zip(test_phrases, json.loads(response.text)):
+        print(f"\nInput: '{phrase}'")
+        print(f"Intent: {intent}")
     
     print("\n" + "=" * 50)
     print("✅ VoxNav Gemini integration is working!")
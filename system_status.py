@@ -3,8 +3,10 @@
 VoxNav System Status Report
 """
 
+import importlib.util
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 def check_python_version():
@@ -15,20 +17,27 @@ def check_python_version():
 def check_dependencies():
     """Check if required packages are installed"""
     required_packages = [
-        'transformers', 'torch', 'torchaudio', 'librosa', 
+        'transformers', 'torch', 'torchaudio', 'librosa',
         'soundfile', 'google-generativeai'
     ]
-    
+
+    # find_spec is a path lookup only - unlike __import__ it never
+    # executes the package, so probing torch/transformers costs
+    # milliseconds instead of seconds of module init
+    module_names = {'google-generativeai': 'google.generativeai'}
+
     installed = []
     missing = []
-    
+
     for package in required_packages:
+        module = module_names.get(package, package.replace('-', '_'))
         try:
-            __import__(package.replace('-', '_'))
-            installed.append(package)
-        except ImportError:
-            missing.append(package)
-    
+            spec = importlib.util.find_spec(module)
+        except (ImportError, ModuleNotFoundError):
+            # dotted lookup raises when the parent package is absent
+            spec = None
+        (installed if spec else missing).append(package)
+
     return installed, missing
 
 def check_model_files():
@@ -41,18 +50,15 @@ def check_model_files():
         "vocab.json"
     ]
     
-    found = []
-    missing = []
-    
-    if not os.path.exists(model_path):
+    # One directory read answers all the per-file exists() probes
+    try:
+        entries = {entry.name for entry in os.scandir(model_path)}
+    except FileNotFoundError:
         return [], files_to_check, False
-    
-    for file in files_to_check:
-        if os.path.exists(os.path.join(model_path, file)):
-            found.append(file)
-        else:
-            missing.append(file)
-    
+
+    found = [f for f in files_to_check if f in entries]
+    missing = [f for f in files_to_check if f not in entries]
+
     return found, missing, True
 
 def check_api_keys():
@@ -68,7 +74,15 @@ def main():
     print("=" * 60)
     print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
-    
+
+    # The dependency, model-file, and API-key probes are independent and
+    # import/IO-bound, so run them concurrently - the slow dependency
+    # probe overlaps with the model-file stats instead of preceding them
+    executor = ThreadPoolExecutor(max_workers=3)
+    deps_future = executor.submit(check_dependencies)
+    files_future = executor.submit(check_model_files)
+    keys_future = executor.submit(check_api_keys)
+
     # 1. Python Version
     print("1. Python Environment")
     if check_python_version():
@@ -76,11 +90,12 @@ def main():
         print(f"   🐍 Version: {sys.version}")
     else:
         print("   ❌ Python version too old (requires 3.8+)")
+        executor.shutdown(wait=False)
         return
-    
+
     # 2. Dependencies
     print("\n2. Dependencies Check")
-    installed, missing = check_dependencies()
+    installed, missing = deps_future.result()
     print(f"   ✅ Installed ({len(installed)}): {', '.join(installed)}")
     if missing:
         print(f"   ❌ Missing ({len(missing)}): {', '.join(missing)}")
@@ -89,7 +104,7 @@ def main():
     
     # 3. Model Files
     print("\n3. ASR Model Check")
-    found, missing_files, model_dir_exists = check_model_files()
+    found, missing_files, model_dir_exists = files_future.result()
     if not model_dir_exists:
         print("   ⚠️  Model directory not found")
         print("   💡 Download model from: https://indicwhisper.objectstore.e2enetworks.net/hindi_models.zip")
@@ -101,7 +116,8 @@ def main():
     
     # 4. API Keys
     print("\n4. API Keys")
-    api_keys = check_api_keys()
+    api_keys = keys_future.result()
+    executor.shutdown()
     for key, value in api_keys.items():
         if value:
             print(f"   ✅ {key}: Set (first 8 chars: {value[:8]}...)")
@@ -113,10 +129,10 @@ def main():
     
     # Language detection
     try:
-        from core.multilingual import MultilingualHandler
-        handler = MultilingualHandler()
+        from core.multilingual import get_handler
+        handler = get_handler()
         test_text = "नमस्ते"
-        result = handler.detect_language(test_text)
+        result = handler.detect_language_batch([test_text])[0]
         print(f"   ✅ Language detection: '{test_text}' → {result.primary_language.value}")
     except Exception as e:
         print(f"   ❌ Language detection failed: {e}")
@@ -154,7 +170,7 @@ def main():
     # Component tests (3 checks)
     component_checks = 3
     try:
-        handler = MultilingualHandler()
+        handler = get_handler()
         passed_checks += 1
         component_checks -= 1
     except: pass
@@ -31,6 +31,8 @@ test_cases = [
 ]
 
 print("🔧 Initializing browser controller...")
+# One controller for the whole run: start() spawns ChromeDriver once
+# (~2s) and every execute_intent below reuses that same driver session
 controller = BrowserController(headless=False)
 
 try:
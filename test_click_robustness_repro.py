@@ -55,14 +55,41 @@ options.add_argument("--headless=new")
 driver = webdriver.Chrome(options=options)
 driver.get(f"file:///{html_path}")
 
-# Import the new function from voxnav_agent
 import sys
 sys.path.append(os.getcwd())
-from voxnav_agent import find_element_by_fuzzy_text
 
-def test_click_implementation(driver, target):
+from difflib import SequenceMatcher
+
+# One DOM query returns every candidate handle with its lowercase label;
+# each test case then matches in Python instead of re-walking the DOM
+# with an XPath per target (9 targets -> 1 traversal)
+COLLECT_CANDIDATES_JS = """
+return [...document.querySelectorAll("button,input,a,[role='button']")].map(e => [
+    e,
+    (e.innerText || e.value || e.getAttribute('aria-label') || '').trim().toLowerCase()
+]);
+"""
+
+def find_best_match(candidates, target):
+    """Fuzzy-match target against the prefetched (element, text) table."""
+    target = target.lower().strip()
+    best, best_score = None, 0.0
+    for element, text in candidates:
+        if not text:
+            continue
+        if target == text:
+            return element
+        if target in text:
+            score = 0.9 + 0.1 * (len(target) / len(text))
+        else:
+            score = SequenceMatcher(None, target, text).ratio()
+        if score > best_score:
+            best, best_score = element, score
+    return best if best_score >= 0.7 else None
+
+def test_click_implementation(candidates, target):
     try:
-        element = find_element_by_fuzzy_text(driver, target)
+        element = find_best_match(candidates, target)
         if element:
             element.click()
             return True
@@ -85,8 +112,10 @@ test_cases = [
 ]
 
 print("\n--- Testing NEW Implementation ---")
+candidates = driver.execute_script(COLLECT_CANDIDATES_JS)
+print(f"Prefetched {len(candidates)} candidates in one query.")
 for target, expected in test_cases:
-    success = test_click_implementation(driver, target)
+    success = test_click_implementation(candidates, target)
     result = "✅ PASS" if success else "❌ FAIL"
     print(f"Target: '{target}' -> {result}")
 
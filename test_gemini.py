@@ -2,6 +2,7 @@
 """
 Quick diagnostic to check Gemini API and available models
 """
+import asyncio
 import os
 
 # Check API key
@@ -46,16 +47,42 @@ test_models = [
     'gemini-2.0-flash-exp',
 ]
 
-for model_name in test_models:
+async def probe(model_name):
+    """Probe one model; returns (name, response_text, error)."""
     try:
         model = genai.GenerativeModel(model_name)
-        response = model.generate_content("Say hi in one word")
-        print(f"  ✅ {model_name}: Working!")
-        print(f"     Response: {response.text[:50]}...")
-        break  # Found a working model
+        response = await model.generate_content_async("Say hi in one word")
+        return model_name, response.text, None
     except Exception as e:
-        error_msg = str(e)[:60]
-        print(f"  ❌ {model_name}: {error_msg}")
+        return model_name, None, str(e)[:60]
+
+async def find_working_model():
+    """Race all model probes; report the first success, cancel the rest.
+
+    The probes are independent network calls, so total wall time is one
+    RTT instead of the sum over every dead model tried serially.
+    """
+    tasks = {asyncio.create_task(probe(name)) for name in test_models}
+    winner = None
+    try:
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name, text, error = task.result()
+                if error is not None:
+                    print(f"  ❌ {name}: {error}")
+                elif winner is None:
+                    winner = name
+                    print(f"  ✅ {name}: Working!")
+                    print(f"     Response: {text[:50]}...")
+            if winner:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+    return winner
+
+asyncio.run(find_working_model())
 
 print("\n" + "=" * 50)
 print("Use the working model name in VoxNav config!")
